@@ -7,6 +7,7 @@ from pathlib import Path
 # Base paths
 BASE_DIR = Path(__file__).resolve().parent
 TEMP_DIR = BASE_DIR / "temp"
+JINJA_CACHE_DIR = BASE_DIR / ".jinja_cache"
 
 # File upload settings
 MAX_UPLOAD_SIZE = 100 * 1024 * 1024  # 100 MB in bytes
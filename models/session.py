@@ -4,6 +4,8 @@ from datetime import datetime
 from typing import Dict, Optional
 import json
 
+import msgspec
+
 
 @dataclass
 class DeletedItemState:
@@ -36,16 +38,21 @@ class DeletedItemState:
         )
 
 
-@dataclass
-class EditState:
-    """Track the state of a single edited item."""
+class EditState(msgspec.Struct):
+    """
+    Track the state of a single edited item.
+
+    A ``msgspec.Struct`` rather than a dataclass: the edit-state file grows
+    with every edit and msgspec decodes JSON straight into C-layout structs,
+    skipping the per-field Python dict walk on load/save.
+    """
     item_id: str
     original_value: str
     edited_value: str
     edited: bool = False
     added: bool = False  # Track if this item was newly added
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
-    
+    timestamp: str = msgspec.field(default_factory=lambda: datetime.now().isoformat())
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -98,16 +105,22 @@ class RowChangeState:
         )
 
 
-@dataclass
-class Session:
-    """Session data for tracking a user's editing session."""
+class Session(msgspec.Struct):
+    """
+    Session data for tracking a user's editing session.
+
+    A ``msgspec.Struct`` so session.json decodes directly into the object in
+    one pass (see ``EditState``).  ``to_dict``/``from_dict`` are kept for
+    callers that work with plain dicts.
+    """
     session_id: str
     has_metadata: bool = False
     has_citations: bool = False
     verify_id_existence: bool = False
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    last_updated: str = field(default_factory=lambda: datetime.now().isoformat())
-    
+    draft_name: Optional[str] = None
+    created_at: str = msgspec.field(default_factory=lambda: datetime.now().isoformat())
+    last_updated: str = msgspec.field(default_factory=lambda: datetime.now().isoformat())
+
     # File paths
     meta_csv_path: Optional[str] = None
     cits_csv_path: Optional[str] = None
@@ -128,6 +141,7 @@ class Session:
             'has_metadata': self.has_metadata,
             'has_citations': self.has_citations,
             'verify_id_existence': self.verify_id_existence,
+            'draft_name': self.draft_name,
             'created_at': self.created_at,
             'last_updated': self.last_updated,
             'meta_csv_path': self.meta_csv_path,
@@ -149,6 +163,7 @@ class Session:
             has_metadata=data.get('has_metadata', False),
             has_citations=data.get('has_citations', False),
             verify_id_existence=data.get('verify_id_existence', False),
+            draft_name=data.get('draft_name'),
             created_at=data.get('created_at', datetime.now().isoformat()),
             last_updated=data.get('last_updated', datetime.now().isoformat()),
             meta_csv_path=data.get('meta_csv_path'),
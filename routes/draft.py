@@ -1,7 +1,6 @@
 """Draft management routes."""
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List, Optional
 
 from services import SessionManager
 
@@ -11,7 +10,7 @@ router = APIRouter()
 class SaveDraftRequest(BaseModel):
     """Request model for saving a draft."""
     session_id: str
-    draft_name: Optional[str] = None
+    draft_name: str | None = None
 
 
 class LoadDraftRequest(BaseModel):
@@ -72,25 +71,12 @@ async def load_draft(request: LoadDraftRequest):
 async def list_drafts():
     """
     List all available drafts.
-    
-    Returns a list of session IDs for all saved drafts.
+
+    Returns summary info for all saved drafts, read from the drafts index
+    in a single call (the index is rebuilt from a directory scan if missing).
     """
-    session_ids = SessionManager.list_sessions()
-    
-    # Load session info for each
-    drafts = []
-    for session_id in session_ids:
-        session = await SessionManager.load_session(session_id)
-        if session:
-            drafts.append({
-                "session_id": session.session_id,
-                "draft_name": getattr(session, 'draft_name', None),
-                "has_metadata": session.has_metadata,
-                "has_citations": session.has_citations,
-                "created_at": session.created_at,
-                "last_updated": session.last_updated
-            })
-    
+    drafts = await SessionManager.list_drafts_summary()
+
     return {"drafts": drafts}
 
 
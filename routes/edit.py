@@ -1,23 +1,58 @@
 """Edit operations routes."""
-from fastapi import APIRouter, HTTPException
+import asyncio
+import functools
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from aiofiles import open as aio_open
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, List, Optional
+from typing import Dict, List
 
 from services import SessionManager, HTMLParser, ValidatorService, CSVExporter
-from services.validator_service import load_jsonl_report
+from services.validator_service import load_jsonl_report, get_validator_pool
 from models import Session, EditState, RowChangeState, DeletedItemState
 from config import TEMP_DIR
 
-# Import oc_validator interface for HTML generation and merging
-from oc_validator.interface.gui import make_gui, merge_html_files
+# oc_validator's interface module is imported lazily inside the handlers that
+# need it (see _generate_html / revalidate) so worker startup doesn't pay its
+# import cost before the first re-validation.
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Chunk size for streaming HTML responses
+_HTML_CHUNK_SIZE = 64 * 1024
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _iter_mmap(mm, chunk_size: int = _HTML_CHUNK_SIZE):
+    """Yield an mmap'd file in chunks, closing the mapping when exhausted."""
+    try:
+        for offset in range(0, len(mm), chunk_size):
+            yield mm[offset:offset + chunk_size]
+    finally:
+        mm.close()
+
+
+def _iter_str(content: str, chunk_size: int = _HTML_CHUNK_SIZE):
+    """Yield a string as UTF-8 chunks without building one large bytes copy."""
+    for offset in range(0, len(content), chunk_size):
+        yield content[offset:offset + chunk_size].encode('utf-8')
+
+
+async def _read_text(path) -> str:
+    """Read a text file asynchronously (gather-friendly helper)."""
+    async with aio_open(path, 'r', encoding='utf-8') as f:
+        return await f.read()
+
+
 def _generate_html(csv_fp: str, report_fp: str, out_fp: str, is_valid: bool) -> None:
     """
     Generate an HTML visualisation for a validated CSV table.
@@ -30,9 +65,43 @@ def _generate_html(csv_fp: str, report_fp: str, out_fp: str, is_valid: bool) ->
     if is_valid:
         ValidatorService._make_no_errors_html(out_fp, csv_fp)
     else:
+        from oc_validator.interface.gui import make_gui
         make_gui(csv_fp, report_fp, out_fp)
 
 
+def _parse_and_export(html_content: str, original_csv_path: str,
+                      out_path: str) -> int:
+    """
+    Parse a table document and stream it to ``out_path`` as CSV in one step.
+
+    Meant to run in a worker process: the rows are consumed where they are
+    parsed, so only the HTML travels to the worker and only the row count
+    comes back — the row list itself is never pickled across the process
+    boundary.  Returns the number of data rows parsed.
+    """
+    rows_data = HTMLParser.parse_table(html_content)
+    if rows_data:
+        CSVExporter.write_csv_file(rows_data, original_csv_path, out_path)
+    return len(rows_data)
+
+
+def _parse_item_id(item_id: str):
+    """
+    Split an item id of the form ``{row}-{field}-{index}`` into
+    ``(row_id, field_name)``.
+
+    Uses two bounded splits instead of split-everything-plus-join, so no
+    intermediate list or joined string is allocated on the hot edit path.
+    Returns None if the id does not have at least three segments.
+    """
+    try:
+        rest, _idx = item_id.rsplit('-', 1)
+        row_id, field_name = rest.split('-', 1)
+    except ValueError:
+        return None
+    return row_id, field_name
+
+
 def _table_type_for_display(session: Session) -> str:
     """
     Return the table_type key to pass to ``SessionManager.load_html`` when
@@ -60,6 +129,16 @@ class EditItemRequest(BaseModel):
     new_value: str
 
 
+class BatchEditEntry(BaseModel):
+    item_id: str
+    new_value: str
+
+
+class EditItemsBatchRequest(BaseModel):
+    session_id: str
+    edits: List[BatchEditEntry]
+
+
 class DeleteItemRequest(BaseModel):
     session_id: str
     item_id: str
@@ -67,15 +146,15 @@ class DeleteItemRequest(BaseModel):
 
 class AddItemRequest(BaseModel):
     session_id: str
-    item_id: Optional[str] = None   # ID of an existing item (for backward compatibility)
-    row_id: Optional[str] = None    # Row ID for adding with value
-    field_name: Optional[str] = None  # Field name for adding with value
-    new_value: Optional[str] = None  # Value for the new item
+    item_id: str | None = None   # ID of an existing item (for backward compatibility)
+    row_id: str | None = None    # Row ID for adding with value
+    field_name: str | None = None  # Field name for adding with value
+    new_value: str | None = None  # Value for the new item
 
 
 class RevalidateRequest(BaseModel):
     session_id: str
-    verify_id_existence: Optional[bool] = None
+    verify_id_existence: bool | None = None
 
 
 class GetFilteredRowsRequest(BaseModel):
@@ -107,12 +186,18 @@ class UndoRedoRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 @router.get("/html/{session_id}")
-async def get_html(session_id: str):
+async def get_html(session_id: str, request: Request):
     """
-    Get current HTML content for a session.
+    Get current HTML content for a session, streamed as ``text/html``.
 
     For paired sessions (metadata + citations) the merged display file is
     returned.  For single-table sessions the individual table HTML is returned.
+
+    Streaming avoids the old JSON envelope, which needed the whole file as a
+    Python str plus a JSON-escaped copy per request.  When the session has no
+    pending edit-log records and nothing to highlight, the file is memory-
+    mapped and streamed zero-copy; otherwise the materialized/highlighted
+    string is streamed in chunks.
     """
     session = await SessionManager.load_session(session_id)
     if not session:
@@ -122,7 +207,36 @@ async def get_html(session_id: str):
     if table_type is None:
         raise HTTPException(status_code=400, detail="No data files found in session")
 
-    html_content = await SessionManager.load_html(session_id, table_type)
+    # Weak ETag over every file that can change the rendered output; a
+    # matching If-None-Match skips materialization, highlighting and the
+    # body transfer entirely for the common "no change since last poll" case.
+    stamps = SessionManager.content_stamp(session_id, table_type)
+    etag = f'W/"{abs(hash(stamps)):x}"'
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304)
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    edit_states, row_change_states = await asyncio.gather(
+        SessionManager.load_edit_state(session_id),
+        SessionManager.load_row_change_state(session_id)
+    )
+    edited_ids = await SessionManager.get_edited_ids(session_id)
+    added_item_ids = [item_id for item_id, state in edit_states.items() if state.added]
+    added_row_ids = [row_id for row_id, state in row_change_states.items() if state.added]
+
+    needs_rewrite = (
+        SessionManager.has_pending_edits(session_id)
+        or edited_ids or added_item_ids or added_row_ids
+    )
+    if not needs_rewrite:
+        # Fast path: serve the on-disk file via mmap, letting the kernel page
+        # it in on demand instead of copying it through a Python str.
+        mm = SessionManager.open_html_mmap(session_id, table_type)
+        if mm is not None:
+            return StreamingResponse(_iter_mmap(mm), media_type="text/html",
+                                     headers=cache_headers)
+
+    html_content = await SessionManager.materialize_html(session_id, table_type)
 
     if not html_content:
         session_dir = TEMP_DIR / session_id
@@ -145,22 +259,15 @@ async def get_html(session_id: str):
     # For paired sessions this is applied to the merged display HTML; item IDs
     # that correspond to meta-table edits are present in the merged HTML, so
     # apply_edit_tracking works correctly regardless.
-    edit_states = await SessionManager.load_edit_state(session_id)
-    if edit_states:
-        edited_ids = [item_id for item_id, state in edit_states.items() if state.edited]
+    if edited_ids:
         html_content = HTMLParser.apply_edit_tracking(html_content, edited_ids)
-        
-        # Apply added tracking (green background on added items)
-        added_item_ids = [item_id for item_id, state in edit_states.items() if state.added]
-        
-        # Load row change state for added rows
-        row_change_states = await SessionManager.load_row_change_state(session_id)
-        added_row_ids = [row_id for row_id, state in row_change_states.items() if state.added]
-        
-        if added_item_ids or added_row_ids:
-            html_content = HTMLParser.apply_added_tracking(html_content, added_item_ids, added_row_ids)
 
-    return {"html": html_content}
+    # Apply added tracking (green background on added items/rows)
+    if added_item_ids or added_row_ids:
+        html_content = HTMLParser.apply_added_tracking(html_content, added_item_ids, added_row_ids)
+
+    return StreamingResponse(_iter_str(html_content), media_type="text/html",
+                             headers=cache_headers)
 
 
 @router.post("/item")
@@ -168,8 +275,13 @@ async def edit_item(request: EditItemRequest):
     """
     Edit a single item in the table.
 
-    The edit is always applied to the *individual* table HTML file
-    (``meta_table.html`` for metadata, ``cits_table.html`` for citations).
+    The edit is recorded as one record appended to the session's edit log
+    (``edits.jsonl``) instead of rewriting the whole HTML file — read paths
+    replay the pending log over the base HTML, and the log is folded back into
+    the HTML before structural mutations and re-validation.  Empty values in
+    multi-value fields remove the item on replay, matching the previous
+    auto-remove behaviour.
+
     For paired sessions the merged display file (``meta_html.html``) is NOT
     updated immediately; it will be regenerated the next time the user
     triggers re-validation.
@@ -178,59 +290,146 @@ async def edit_item(request: EditItemRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Always edit the individual (parseable) HTML, never the merged display.
-    table_type = 'meta' if session.has_metadata else 'cits'
+    async with SessionManager.session_lock(request.session_id):
+        # Edits always target the individual (parseable) table, never the merged display.
+        table_type = 'meta' if session.has_metadata else 'cits'
 
-    html_content = await SessionManager.load_html(request.session_id, table_type)
-    if not html_content:
-        raise HTTPException(status_code=404, detail="HTML content not found")
+        # Dict lookup against the cached item index — no per-edit document parse
+        item_index = await SessionManager.get_item_index(request.session_id, table_type)
+        if item_index is None:
+            raise HTTPException(status_code=404, detail="HTML content not found")
 
-    original_value = HTMLParser.get_field_data_by_item_id(html_content, request.item_id)
-    if original_value is None:
-        raise HTTPException(status_code=404,
-                            detail=f"Item '{request.item_id}' not found")
-
-    # Save snapshot for undo BEFORE applying the mutation
-    await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
-
-    updated_html = HTMLParser.update_item_value(html_content, request.item_id, request.new_value)
-
-    # Auto-remove empty items from multi-value fields so that no stray
-    # separators are left in the HTML (and therefore in the exported CSV).
-    _MULTI_VALUE_FIELDS = set(HTMLParser.ITEM_SEPARATORS.keys())
-    parts = request.item_id.split('-')
-    if len(parts) >= 3:
-        # item_id format: "{row}-{field}-{index}"
-        # field name is everything between the first and last component
-        field_name = '-'.join(parts[1:-1])
-        if field_name in _MULTI_VALUE_FIELDS and request.new_value.strip() == '':
-            updated_html = HTMLParser.remove_item(updated_html, request.item_id)
-
-    await SessionManager.save_html(request.session_id, updated_html, table_type)
-
-    # Track the edit
-    edit_states = await SessionManager.load_edit_state(request.session_id)
-    if request.item_id not in edit_states:
-        edit_states[request.item_id] = EditState(
-            item_id=request.item_id,
-            original_value=original_value,
-            edited_value=request.new_value,
-            edited=True
-        )
-    else:
-        edit_states[request.item_id].edited_value = request.new_value
-        edit_states[request.item_id].edited = True
+        original_value = item_index.get(request.item_id)
+        if original_value is None:
+            raise HTTPException(status_code=404,
+                                detail=f"Item '{request.item_id}' not found")
+
+        # Submit-on-blur UIs routinely re-submit unchanged values; skip the
+        # whole write chain (and mark_edited) when nothing actually changed.
+        if original_value == request.new_value:
+            return {
+                "success": True,
+                "original_value": original_value,
+                "new_value": request.new_value,
+                "noop": True
+            }
+
+        # One appended record instead of a full-file rewrite.  Appending clears
+        # the redo log; redo snapshots are likewise forward history, so drop them.
+        await SessionManager.append_edit_entries(request.session_id, [{
+            'ts': datetime.now().isoformat(),
+            'item_id': request.item_id,
+            'old': original_value,
+            'new': request.new_value
+        }], table_type)
+        await SessionManager.clear_redo_snapshots(request.session_id, table_type)
+
+        # Track the edit
+        edit_states = await SessionManager.load_edit_state(request.session_id)
+        if request.item_id not in edit_states:
+            edit_states[request.item_id] = EditState(
+                item_id=request.item_id,
+                original_value=original_value,
+                edited_value=request.new_value,
+                edited=True
+            )
+        else:
+            edit_states[request.item_id].edited_value = request.new_value
+            edit_states[request.item_id].edited = True
 
-    await SessionManager.save_edit_state(request.session_id, edit_states)
+        # Debounced like the session save — the fsynced journal record above
+        # already makes the edit durable
+        SessionManager.schedule_edit_state_save(request.session_id, edit_states)
 
-    session.mark_edited()
-    await SessionManager.save_session(session)
+        session.mark_edited()
+        SessionManager.schedule_save(session)
 
-    return {
-        "success": True,
-        "original_value": original_value,
-        "new_value": request.new_value
-    }
+        return {
+            "success": True,
+            "original_value": original_value,
+            "new_value": request.new_value
+        }
+
+
+@router.post("/items/batch")
+async def edit_items_batch(request: EditItemsBatchRequest):
+    """
+    Apply several item edits in one call (e.g. multi-cell paste).
+
+    All records are appended to the edit log with a single write and the
+    edit-state / session files are saved once, so the cost is amortized over
+    the whole batch rather than paid per item.
+    """
+    if not request.edits:
+        raise HTTPException(status_code=400, detail="No edits provided")
+
+    session = await SessionManager.load_session(request.session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    async with SessionManager.session_lock(request.session_id):
+        table_type = 'meta' if session.has_metadata else 'cits'
+
+        # One cached index lookup serves the whole batch
+        item_index = await SessionManager.get_item_index(request.session_id, table_type)
+        if item_index is None:
+            raise HTTPException(status_code=404, detail="HTML content not found")
+
+        entries = []
+        results = []
+        for edit in request.edits:
+            original_value = item_index.get(edit.item_id)
+            if original_value is None:
+                raise HTTPException(status_code=404,
+                                    detail=f"Item '{edit.item_id}' not found")
+            # Unchanged values need no log record or state update
+            if original_value == edit.new_value:
+                results.append({
+                    "item_id": edit.item_id,
+                    "original_value": original_value,
+                    "new_value": edit.new_value,
+                    "noop": True
+                })
+                continue
+            entries.append({
+                'ts': datetime.now().isoformat(),
+                'item_id': edit.item_id,
+                'old': original_value,
+                'new': edit.new_value
+            })
+            results.append({
+                "item_id": edit.item_id,
+                "original_value": original_value,
+                "new_value": edit.new_value
+            })
+
+        if not entries:
+            # Every submitted value matched the current one — nothing to write
+            return {"success": True, "edited": results, "count": len(results)}
+
+        await SessionManager.append_edit_entries(request.session_id, entries, table_type)
+        await SessionManager.clear_redo_snapshots(request.session_id, table_type)
+
+        edit_states = await SessionManager.load_edit_state(request.session_id)
+        for entry in entries:
+            item_id = entry['item_id']
+            if item_id not in edit_states:
+                edit_states[item_id] = EditState(
+                    item_id=item_id,
+                    original_value=entry['old'],
+                    edited_value=entry['new'],
+                    edited=True
+                )
+            else:
+                edit_states[item_id].edited_value = entry['new']
+                edit_states[item_id].edited = True
+
+        SessionManager.schedule_edit_state_save(request.session_id, edit_states)
+
+        session.mark_edited()
+        SessionManager.schedule_save(session)
+
+        return {"success": True, "edited": results, "count": len(results)}
 
 
 @router.post("/item/add")
@@ -253,132 +452,133 @@ async def add_item_to_cell(request: AddItemRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Determine mode: adding with value or adding empty item
-    if request.new_value is not None and request.row_id and request.field_name:
-        # Adding with value directly
-        field_name = request.field_name
+    async with SessionManager.session_lock(request.session_id):
+        # Determine mode: adding with value or adding empty item
+        if request.new_value is not None and request.row_id and request.field_name:
+            # Adding with value directly
+            field_name = request.field_name
         
-        # Determine if field is multi-value or single-value
-        is_multi_value = field_name in HTMLParser.ITEM_SEPARATORS
-        separator = HTMLParser.ITEM_SEPARATORS.get(field_name, None)
+            # Determine if field is multi-value or single-value
+            is_multi_value = field_name in HTMLParser.ITEM_SEPARATORS
+            separator = HTMLParser.ITEM_SEPARATORS.get(field_name, None)
         
-        # Always operate on the individual (parseable) HTML
-        table_type = 'meta' if session.has_metadata else 'cits'
+            # Always operate on the individual (parseable) HTML
+            table_type = 'meta' if session.has_metadata else 'cits'
 
-        html_content = await SessionManager.load_html(request.session_id, table_type)
-        if not html_content:
-            raise HTTPException(status_code=404, detail="HTML content not found")
+            html_content = await SessionManager.compact_edit_log(request.session_id, table_type)
+            if not html_content:
+                raise HTTPException(status_code=404, detail="HTML content not found")
 
-        # Save snapshot for undo BEFORE applying the mutation
-        await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
+            # Save snapshot for undo BEFORE applying the mutation
+            await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
 
-        # Use HTMLParser helper to check cell state
-        has_value, container_count = HTMLParser.get_cell_state(
-            html_content, request.row_id, field_name
-        )
-        
-        if not has_value:
-            # Path 1: Empty cell (any field type) → clear_cell + update_item_value
-            # Initialize the cell and set the value
-            # First clear any existing empty containers, then set the value
-            new_html, new_item_id = HTMLParser.clear_cell(
+            # Use HTMLParser helper to check cell state
+            has_value, container_count = HTMLParser.get_cell_state(
                 html_content, request.row_id, field_name
             )
-            if not new_item_id:
-                raise HTTPException(status_code=404, detail="Failed to initialize cell")
-            # Update the empty item with the value
-            new_html = HTMLParser.update_item_value(new_html, new_item_id, request.new_value)
-        else:
-            # Cell has existing values
-            if not is_multi_value:
-                # Path 2: Non-empty single-value field → raise error (defensive)
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Cannot add to single-value field '{field_name}' that already has a value"
-                )
-            else:
-                # Path 3: Non-empty multi-value field → add_item with separator
-                # Append new value after the last existing item
-                row_num = request.row_id.replace('row', '') if request.row_id.startswith('row') else request.row_id
-                ref_item_id = f"{row_num}-{field_name}-{container_count-1}"
-                
-                new_html, new_item_id = HTMLParser.add_item(
-                    html_content, ref_item_id, separator, request.new_value
+        
+            if not has_value:
+                # Path 1: Empty cell (any field type) → clear_cell + update_item_value
+                # Initialize the cell and set the value
+                # First clear any existing empty containers, then set the value
+                new_html, new_item_id = HTMLParser.clear_cell(
+                    html_content, request.row_id, field_name
                 )
-                
                 if not new_item_id:
+                    raise HTTPException(status_code=404, detail="Failed to initialize cell")
+                # Update the empty item with the value
+                new_html = HTMLParser.update_item_value(new_html, new_item_id, request.new_value)
+            else:
+                # Cell has existing values
+                if not is_multi_value:
+                    # Path 2: Non-empty single-value field → raise error (defensive)
                     raise HTTPException(
-                        status_code=404,
-                        detail=f"Failed to add item. Reference item '{ref_item_id}' not found"
+                        status_code=400,
+                        detail=f"Cannot add to single-value field '{field_name}' that already has a value"
                     )
+                else:
+                    # Path 3: Non-empty multi-value field → add_item with separator
+                    # Append new value after the last existing item
+                    row_num = request.row_id.replace('row', '') if request.row_id.startswith('row') else request.row_id
+                    ref_item_id = f"{row_num}-{field_name}-{container_count-1}"
+                
+                    new_html, new_item_id = HTMLParser.add_item(
+                        html_content, ref_item_id, separator, request.new_value
+                    )
+                
+                    if not new_item_id:
+                        raise HTTPException(
+                            status_code=404,
+                            detail=f"Failed to add item. Reference item '{ref_item_id}' not found"
+                        )
 
-        await SessionManager.save_html(request.session_id, new_html, table_type)
-
-        # Mark the new item as added
-        edit_states = await SessionManager.load_edit_state(request.session_id)
-        edit_states[new_item_id] = EditState(
-            item_id=new_item_id,
-            original_value='',
-            edited_value=request.new_value,
-            added=True,
-            edited=False
-        )
-        await SessionManager.save_edit_state(request.session_id, edit_states)
-
-        session.mark_edited()
-        await SessionManager.save_session(session)
-
-        return {
-            "success": True,
-            "new_item_id": new_item_id
-        }
+            await SessionManager.save_html(request.session_id, new_html, table_type)
 
-    elif request.item_id:
-        # Path 4: Backward compatibility - adding empty item to multi-value field
-        parts = request.item_id.split('-')
-        if len(parts) < 3:
-            raise HTTPException(status_code=400,
-                                detail=f"Invalid item_id format: '{request.item_id}'")
-        field_name = '-'.join(parts[1:-1])
-        
-        # This path is only for multi-value fields (backward compatibility)
-        if field_name not in HTMLParser.ITEM_SEPARATORS:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Field '{field_name}' is not a multi-value field"
+            # Mark the new item as added
+            edit_states = await SessionManager.load_edit_state(request.session_id)
+            edit_states[new_item_id] = EditState(
+                item_id=new_item_id,
+                original_value='',
+                edited_value=request.new_value,
+                added=True,
+                edited=False
             )
+            await SessionManager.save_edit_state(request.session_id, edit_states)
+
+            session.mark_edited()
+            await SessionManager.save_session(session)
+
+            return {
+                "success": True,
+                "new_item_id": new_item_id
+            }
+
+        elif request.item_id:
+            # Path 4: Backward compatibility - adding empty item to multi-value field
+            parsed = _parse_item_id(request.item_id)
+            if parsed is None:
+                raise HTTPException(status_code=400,
+                                    detail=f"Invalid item_id format: '{request.item_id}'")
+            field_name = parsed[1]
+        
+            # This path is only for multi-value fields (backward compatibility)
+            if field_name not in HTMLParser.ITEM_SEPARATORS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Field '{field_name}' is not a multi-value field"
+                )
 
-        separator = HTMLParser.ITEM_SEPARATORS[field_name]
+            separator = HTMLParser.ITEM_SEPARATORS[field_name]
 
-        # Always operate on the individual (parseable) HTML
-        table_type = 'meta' if session.has_metadata else 'cits'
+            # Always operate on the individual (parseable) HTML
+            table_type = 'meta' if session.has_metadata else 'cits'
 
-        html_content = await SessionManager.load_html(request.session_id, table_type)
-        if not html_content:
-            raise HTTPException(status_code=404, detail="HTML content not found")
+            html_content = await SessionManager.compact_edit_log(request.session_id, table_type)
+            if not html_content:
+                raise HTTPException(status_code=404, detail="HTML content not found")
 
-        # Save snapshot for undo BEFORE applying the mutation
-        await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
+            # Save snapshot for undo BEFORE applying the mutation
+            await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
 
-        new_html, new_item_id = HTMLParser.add_item(html_content, request.item_id, separator)
-        if not new_item_id:
-            raise HTTPException(status_code=404,
-                                detail=f"Item '{request.item_id}' not found in HTML")
+            new_html, new_item_id = HTMLParser.add_item(html_content, request.item_id, separator)
+            if not new_item_id:
+                raise HTTPException(status_code=404,
+                                    detail=f"Item '{request.item_id}' not found in HTML")
 
-        await SessionManager.save_html(request.session_id, new_html, table_type)
+            await SessionManager.save_html(request.session_id, new_html, table_type)
 
-        session.mark_edited()
-        await SessionManager.save_session(session)
+            session.mark_edited()
+            await SessionManager.save_session(session)
 
-        return {
-            "success": True,
-            "new_item_id": new_item_id
-        }
-    else:
-        raise HTTPException(
-            status_code=400,
-            detail="Must provide either (row_id, field_name, new_value) or item_id"
-        )
+            return {
+                "success": True,
+                "new_item_id": new_item_id
+            }
+        else:
+            raise HTTPException(
+                status_code=400,
+                detail="Must provide either (row_id, field_name, new_value) or item_id"
+            )
 
 
 @router.delete("/item")
@@ -395,52 +595,52 @@ async def delete_item(request: DeleteItemRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Always operate on the individual (parseable) HTML
-    table_type = 'meta' if session.has_metadata else 'cits'
+    async with SessionManager.session_lock(request.session_id):
+        # Always operate on the individual (parseable) HTML
+        table_type = 'meta' if session.has_metadata else 'cits'
 
-    html_content = await SessionManager.load_html(request.session_id, table_type)
-    if not html_content:
-        raise HTTPException(status_code=404, detail="HTML content not found")
+        html_content = await SessionManager.compact_edit_log(request.session_id, table_type)
+        if not html_content:
+            raise HTTPException(status_code=404, detail="HTML content not found")
 
-    # Capture original value before deletion for ghost overlay
-    original_value = HTMLParser.get_field_data_by_item_id(html_content, request.item_id)
+        # Capture original value before deletion for ghost overlay
+        original_value = HTMLParser.get_field_data_by_item_id(html_content, request.item_id)
     
-    # Parse item_id to get row_id and field_name
-    parts = request.item_id.split('-')
-    if len(parts) >= 3:
-        row_id = parts[0]
-        field_name = '-'.join(parts[1:-1])
+        # Parse item_id to get row_id and field_name
+        parsed = _parse_item_id(request.item_id)
+        if parsed is not None:
+            row_id, field_name = parsed
         
-        # Save deleted item state for ghost overlay
-        deleted_items = await SessionManager.load_deleted_item_state(request.session_id)
-        deleted_items[request.item_id] = DeletedItemState(
-            item_id=request.item_id,
-            original_value=original_value or '',
-            row_id=row_id,
-            field_name=field_name
-        )
-        await SessionManager.save_deleted_item_state(request.session_id, deleted_items)
+            # Save deleted item state for ghost overlay
+            deleted_items = await SessionManager.load_deleted_item_state(request.session_id)
+            deleted_items[request.item_id] = DeletedItemState(
+                item_id=request.item_id,
+                original_value=original_value or '',
+                row_id=row_id,
+                field_name=field_name
+            )
+            await SessionManager.save_deleted_item_state(request.session_id, deleted_items)
 
-    # Save snapshot for undo BEFORE applying mutation
-    await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
+        # Save snapshot for undo BEFORE applying mutation
+        await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
 
-    updated_html = HTMLParser.remove_item(html_content, request.item_id)
+        updated_html = HTMLParser.remove_item(html_content, request.item_id)
 
-    await SessionManager.save_html(request.session_id, updated_html, table_type)
+        await SessionManager.save_html(request.session_id, updated_html, table_type)
 
-    # Remove edit tracking for the deleted item
-    edit_states = await SessionManager.load_edit_state(request.session_id)
-    if request.item_id in edit_states:
-        del edit_states[request.item_id]
-        await SessionManager.save_edit_state(request.session_id, edit_states)
+        # Remove edit tracking for the deleted item
+        edit_states = await SessionManager.load_edit_state(request.session_id)
+        if request.item_id in edit_states:
+            del edit_states[request.item_id]
+            await SessionManager.save_edit_state(request.session_id, edit_states)
 
-    session.mark_edited()
-    await SessionManager.save_session(session)
+        session.mark_edited()
+        await SessionManager.save_session(session)
 
-    return {
-        "success": True,
-        "item_id": request.item_id
-    }
+        return {
+            "success": True,
+            "item_id": request.item_id
+        }
 
 
 @router.post("/row/delete")
@@ -455,42 +655,42 @@ async def delete_row(request: DeleteRowRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    table_type = 'meta' if session.has_metadata else 'cits'
-    html_content = await SessionManager.load_html(request.session_id, table_type)
-    if not html_content:
-        raise HTTPException(status_code=404, detail="HTML content not found")
+    async with SessionManager.session_lock(request.session_id):
+        table_type = 'meta' if session.has_metadata else 'cits'
+        html_content = await SessionManager.compact_edit_log(request.session_id, table_type)
+        if not html_content:
+            raise HTTPException(status_code=404, detail="HTML content not found")
 
-    # Capture all item values in the row before deletion for ghost overlay
-    row_item_ids = HTMLParser.get_row_item_ids(html_content, request.row_id)
-    deleted_items = await SessionManager.load_deleted_item_state(request.session_id)
+        # Capture all item values in the row before deletion for ghost overlay
+        row_item_ids = HTMLParser.get_row_item_ids(html_content, request.row_id)
+        deleted_items = await SessionManager.load_deleted_item_state(request.session_id)
     
-    for item_id in row_item_ids:
-        original_value = HTMLParser.get_field_data_by_item_id(html_content, item_id)
-        parts = item_id.split('-')
-        if len(parts) >= 3:
-            row_id = parts[0]
-            field_name = '-'.join(parts[1:-1])
+        for item_id in row_item_ids:
+            original_value = HTMLParser.get_field_data_by_item_id(html_content, item_id)
+            parsed = _parse_item_id(item_id)
+            if parsed is not None:
+                row_id, field_name = parsed
             
-            # Save deleted item state for ghost overlay
-            deleted_items[item_id] = DeletedItemState(
-                item_id=item_id,
-                original_value=original_value or '',
-                row_id=row_id,
-                field_name=field_name
-            )
+                # Save deleted item state for ghost overlay
+                deleted_items[item_id] = DeletedItemState(
+                    item_id=item_id,
+                    original_value=original_value or '',
+                    row_id=row_id,
+                    field_name=field_name
+                )
     
-    await SessionManager.save_deleted_item_state(request.session_id, deleted_items)
+        await SessionManager.save_deleted_item_state(request.session_id, deleted_items)
 
-    # Save snapshot for undo BEFORE applying mutation
-    await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
+        # Save snapshot for undo BEFORE applying mutation
+        await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
 
-    updated_html = HTMLParser.delete_row(html_content, request.row_id)
-    await SessionManager.save_html(request.session_id, updated_html, table_type)
+        updated_html = HTMLParser.delete_row(html_content, request.row_id)
+        await SessionManager.save_html(request.session_id, updated_html, table_type)
 
-    session.mark_edited()
-    await SessionManager.save_session(session)
+        session.mark_edited()
+        await SessionManager.save_session(session)
 
-    return {"success": True, "row_id": request.row_id}
+        return {"success": True, "row_id": request.row_id}
 
 
 @router.post("/row/add")
@@ -506,33 +706,34 @@ async def add_row(request: AddRowRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    table_type = 'meta' if session.has_metadata else 'cits'
-    html_content = await SessionManager.load_html(request.session_id, table_type)
-    if not html_content:
-        raise HTTPException(status_code=404, detail="HTML content not found")
+    async with SessionManager.session_lock(request.session_id):
+        table_type = 'meta' if session.has_metadata else 'cits'
+        html_content = await SessionManager.compact_edit_log(request.session_id, table_type)
+        if not html_content:
+            raise HTTPException(status_code=404, detail="HTML content not found")
 
-    # Save snapshot for undo BEFORE applying the mutation
-    await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
+        # Save snapshot for undo BEFORE applying the mutation
+        await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
 
-    updated_html, new_row_id = HTMLParser.add_row(html_content)
-    if not new_row_id:
-        raise HTTPException(status_code=500, detail="Failed to add new row")
+        updated_html, new_row_id = HTMLParser.add_row(html_content)
+        if not new_row_id:
+            raise HTTPException(status_code=500, detail="Failed to add new row")
 
-    await SessionManager.save_html(request.session_id, updated_html, table_type)
+        await SessionManager.save_html(request.session_id, updated_html, table_type)
 
-    # Mark the new row as added
-    row_change_states = await SessionManager.load_row_change_state(request.session_id)
-    row_change_states[new_row_id] = RowChangeState(
-        row_id=new_row_id,
-        added=True,
-        deleted=False
-    )
-    await SessionManager.save_row_change_state(request.session_id, row_change_states)
+        # Mark the new row as added
+        row_change_states = await SessionManager.load_row_change_state(request.session_id)
+        row_change_states[new_row_id] = RowChangeState(
+            row_id=new_row_id,
+            added=True,
+            deleted=False
+        )
+        await SessionManager.save_row_change_state(request.session_id, row_change_states)
 
-    session.mark_edited()
-    await SessionManager.save_session(session)
+        session.mark_edited()
+        await SessionManager.save_session(session)
 
-    return {"success": True, "row_id": new_row_id}
+        return {"success": True, "row_id": new_row_id}
 
 
 @router.post("/cell/clear")
@@ -551,60 +752,60 @@ async def clear_cell_route(request: ClearCellRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    table_type = 'meta' if session.has_metadata else 'cits'
-    html_content = await SessionManager.load_html(request.session_id, table_type)
-    if not html_content:
-        raise HTTPException(status_code=404, detail="HTML content not found")
+    async with SessionManager.session_lock(request.session_id):
+        table_type = 'meta' if session.has_metadata else 'cits'
+        html_content = await SessionManager.compact_edit_log(request.session_id, table_type)
+        if not html_content:
+            raise HTTPException(status_code=404, detail="HTML content not found")
 
-    # Get all item-container IDs in the cell before clearing
-    cell_item_ids = HTMLParser.get_cell_item_ids(
-        html_content, request.row_id, request.field_name
-    )
+        # Get all item-container IDs in the cell before clearing
+        cell_item_ids = HTMLParser.get_cell_item_ids(
+            html_content, request.row_id, request.field_name
+        )
     
-    # Save deleted item states for ghost overlay (similar to DeleteItemRequest)
-    deleted_items = await SessionManager.load_deleted_item_state(request.session_id)
-    for item_id in cell_item_ids:
-        original_value = HTMLParser.get_field_data_by_item_id(html_content, item_id)
-        parts = item_id.split('-')
-        if len(parts) >= 3:
-            row_id = parts[0]
-            field_name = '-'.join(parts[1:-1])
+        # Save deleted item states for ghost overlay (similar to DeleteItemRequest)
+        deleted_items = await SessionManager.load_deleted_item_state(request.session_id)
+        for item_id in cell_item_ids:
+            original_value = HTMLParser.get_field_data_by_item_id(html_content, item_id)
+            parsed = _parse_item_id(item_id)
+            if parsed is not None:
+                row_id, field_name = parsed
             
-            # Save deleted item state for ghost overlay
-            deleted_items[item_id] = DeletedItemState(
-                item_id=item_id,
-                original_value=original_value or '',
-                row_id=row_id,
-                field_name=field_name
-            )
+                # Save deleted item state for ghost overlay
+                deleted_items[item_id] = DeletedItemState(
+                    item_id=item_id,
+                    original_value=original_value or '',
+                    row_id=row_id,
+                    field_name=field_name
+                )
     
-    await SessionManager.save_deleted_item_state(request.session_id, deleted_items)
+        await SessionManager.save_deleted_item_state(request.session_id, deleted_items)
 
-    # Save snapshot for undo BEFORE applying the mutation
-    await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
+        # Save snapshot for undo BEFORE applying the mutation
+        await SessionManager.push_undo_snapshot(request.session_id, html_content, table_type)
 
-    new_html, new_item_id = HTMLParser.clear_cell(
-        html_content, request.row_id, request.field_name
-    )
-    if not new_item_id:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Cell '{request.field_name}' not found in row '{request.row_id}'"
+        new_html, new_item_id = HTMLParser.clear_cell(
+            html_content, request.row_id, request.field_name
         )
+        if not new_item_id:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Cell '{request.field_name}' not found in row '{request.row_id}'"
+            )
 
-    await SessionManager.save_html(request.session_id, new_html, table_type)
+        await SessionManager.save_html(request.session_id, new_html, table_type)
 
-    # Remove edit tracking for all cleared items (similar to DeleteItemRequest)
-    edit_states = await SessionManager.load_edit_state(request.session_id)
-    for item_id in cell_item_ids:
-        if item_id in edit_states:
-            del edit_states[item_id]
-    await SessionManager.save_edit_state(request.session_id, edit_states)
+        # Remove edit tracking for all cleared items (similar to DeleteItemRequest)
+        edit_states = await SessionManager.load_edit_state(request.session_id)
+        for item_id in cell_item_ids:
+            if item_id in edit_states:
+                del edit_states[item_id]
+        await SessionManager.save_edit_state(request.session_id, edit_states)
 
-    session.mark_edited()
-    await SessionManager.save_session(session)
+        session.mark_edited()
+        await SessionManager.save_session(session)
 
-    return {"success": True, "new_item_id": new_item_id}
+        return {"success": True, "new_item_id": new_item_id}
 
 
 @router.post("/revalidate")
@@ -634,179 +835,208 @@ async def revalidate(request: RevalidateRequest):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    verify_id = (request.verify_id_existence
-                 if request.verify_id_existence is not None
-                 else session.verify_id_existence)
+    async with SessionManager.session_lock(request.session_id):
+        verify_id = (request.verify_id_existence
+                     if request.verify_id_existence is not None
+                     else session.verify_id_existence)
 
-    session_dir = TEMP_DIR / request.session_id
+        session_dir = TEMP_DIR / request.session_id
 
-    try:
-        if session.has_metadata and session.has_citations:
-            # ── Paired re-validation ────────────────────────────────────────
-            meta_html = await SessionManager.load_html(request.session_id, 'meta')
-            cits_html = await SessionManager.load_html(request.session_id, 'cits')
+        # Fold any pending value edits into the base HTML before re-validating
+        await SessionManager.compact_edit_log(
+            request.session_id, 'meta' if session.has_metadata else 'cits'
+        )
 
-            if not meta_html:
-                raise HTTPException(status_code=404,
-                                    detail="Individual metadata HTML not found")
-            if not cits_html:
-                raise HTTPException(status_code=404,
-                                    detail="Individual citations HTML not found")
-
-            # Parse current table data from individual HTML files
-            try:
-                meta_rows = HTMLParser.parse_table(meta_html)
-                cits_rows = HTMLParser.parse_table(cits_html)
-            except Exception as e:
-                raise ValueError(f"Failed to parse HTML tables: {e}")
-
-            if not meta_rows:
-                raise ValueError("No data found in metadata HTML table")
-            if not cits_rows:
-                raise ValueError("No data found in citations HTML table")
-
-            # Export edited rows back to temporary CSV files
-            meta_csv_content = CSVExporter.rows_to_csv(meta_rows, session.meta_csv_path)
-            cits_csv_content = CSVExporter.rows_to_csv(cits_rows, session.cits_csv_path)
-
-            temp_meta_csv = session_dir / 'temp_meta_revalidate.csv'
-            temp_cits_csv = session_dir / 'temp_cits_revalidate.csv'
-
-            with open(temp_meta_csv, 'w', encoding='utf-8') as f:
-                f.write(meta_csv_content)
-            with open(temp_cits_csv, 'w', encoding='utf-8') as f:
-                f.write(cits_csv_content)
-
-            # Run paired validation via ClosureValidator
-            meta_is_valid, cits_is_valid, meta_report_path, cits_report_path = \
-                ValidatorService.validate_pair(
-                    meta_csv_path=str(temp_meta_csv),
-                    cits_csv_path=str(temp_cits_csv),
-                    meta_output_dir=str(session_dir),
-                    cits_output_dir=str(session_dir),
-                    verify_id_existence=verify_id
+        # CPU-bound steps (table parsing, CSV export, validation, HTML
+        # generation) all go to the validator worker pool: they are pure
+        # Python, so even a thread would hold the GIL and stall the loop.
+        loop = asyncio.get_running_loop()
+
+        try:
+            if session.has_metadata and session.has_citations:
+                # ── Paired re-validation ────────────────────────────────────────
+                # The two table files are independent — read them concurrently
+                meta_html, cits_html = await asyncio.gather(
+                    SessionManager.load_html(request.session_id, 'meta'),
+                    SessionManager.load_html(request.session_id, 'cits')
                 )
 
-            # Regenerate individual HTML files
-            meta_table_path = session_dir / 'meta_table.html'
-            cits_table_path = session_dir / 'cits_table.html'
-
-            _generate_html(str(temp_meta_csv), meta_report_path,
-                           str(meta_table_path), meta_is_valid)
-            _generate_html(str(temp_cits_csv), cits_report_path,
-                           str(cits_table_path), cits_is_valid)
-
-            with open(meta_table_path, 'r', encoding='utf-8') as f:
-                new_meta_html = f.read()
-            with open(cits_table_path, 'r', encoding='utf-8') as f:
-                new_cits_html = f.read()
-
-            await SessionManager.save_html(request.session_id, new_meta_html, 'meta')
-            await SessionManager.save_html(request.session_id, new_cits_html, 'cits')
-
-            # Re-merge and save as display file
-            merged_path = session_dir / 'meta_html.html'
-            merge_html_files(str(meta_table_path), str(cits_table_path),
-                             str(merged_path))
-            with open(merged_path, 'r', encoding='utf-8') as f:
-                merged_content = f.read()
-            await SessionManager.save_html(request.session_id, merged_content, 'display')
-
-            # Update baseline snapshots for deletion detection
-            await SessionManager.save_baseline_snapshot(request.session_id, new_meta_html, 'meta')
-            await SessionManager.save_baseline_snapshot(request.session_id, new_cits_html, 'cits')
-
-            # Update session report paths
-            session.meta_report_path = meta_report_path
-            session.cits_report_path = cits_report_path
-
-            total_error_count = len(load_jsonl_report(meta_report_path)) + len(load_jsonl_report(cits_report_path))
-
-            # Clean up temp files
-            temp_meta_csv.unlink(missing_ok=True)
-            temp_cits_csv.unlink(missing_ok=True)
-
-        else:
-            # ── Single-table re-validation ──────────────────────────────────
-            table_type = 'meta' if session.has_metadata else 'cits'
-
-            html_content = await SessionManager.load_html(request.session_id, table_type)
-            if not html_content:
-                raise HTTPException(status_code=404, detail="HTML content not found")
+                if not meta_html:
+                    raise HTTPException(status_code=404,
+                                        detail="Individual metadata HTML not found")
+                if not cits_html:
+                    raise HTTPException(status_code=404,
+                                        detail="Individual citations HTML not found")
+
+                # Parse the current table data and stream it back out as CSV
+                # in a single worker round trip per table: only the HTML is
+                # sent over, only the row count comes back.  The fixed scratch
+                # paths are reused across calls (re-validation is serialized
+                # by the session lock) — open/truncate instead of a
+                # create/unlink pair per run.
+                temp_meta_csv = session_dir / 'scratch_meta_revalidate.csv'
+                temp_cits_csv = session_dir / 'scratch_cits_revalidate.csv'
+
+                try:
+                    meta_count, cits_count = await asyncio.gather(
+                        loop.run_in_executor(get_validator_pool(), _parse_and_export,
+                                             meta_html, session.meta_csv_path,
+                                             str(temp_meta_csv)),
+                        loop.run_in_executor(get_validator_pool(), _parse_and_export,
+                                             cits_html, session.cits_csv_path,
+                                             str(temp_cits_csv))
+                    )
+                except Exception as e:
+                    raise ValueError(f"Failed to parse HTML tables: {e}")
+
+                if not meta_count:
+                    raise ValueError("No data found in metadata HTML table")
+                if not cits_count:
+                    raise ValueError("No data found in citations HTML table")
+
+                # Run paired validation via ClosureValidator in a worker process
+                meta_is_valid, cits_is_valid, meta_report_path, cits_report_path = \
+                    await loop.run_in_executor(
+                        get_validator_pool(),
+                        functools.partial(
+                            ValidatorService.validate_pair,
+                            meta_csv_path=str(temp_meta_csv),
+                            cits_csv_path=str(temp_cits_csv),
+                            meta_output_dir=str(session_dir),
+                            cits_output_dir=str(session_dir),
+                            verify_id_existence=verify_id
+                        )
+                    )
 
-            # Parse current table data from HTML
-            try:
-                rows_data = HTMLParser.parse_table(html_content)
-            except Exception as e:
-                raise ValueError(f"Failed to parse HTML table: {e}")
-
-            if not rows_data:
-                raise ValueError("No data found in HTML table")
-
-            # Export rows back to temporary CSV
-            original_csv_path = (session.meta_csv_path if session.has_metadata
-                                  else session.cits_csv_path)
-            csv_content = CSVExporter.rows_to_csv(rows_data, original_csv_path)
-
-            temp_csv_path = session_dir / 'temp_revalidate.csv'
-            with open(temp_csv_path, 'w', encoding='utf-8') as f:
-                f.write(csv_content)
-
-            # Run validation — returns (is_valid, report_path) directly.
-            # The report_path is taken from validator.output_fp_json, so it is
-            # always the file that was *just* written, regardless of how many
-            # previous runs have created incrementing suffixes in the directory.
-            is_valid, report_path = ValidatorService.validate_single(
-                csv_path=str(temp_csv_path),
-                output_dir=str(session_dir),
-                verify_id_existence=verify_id
-            )
+                # Regenerate individual HTML files (make_gui is sync/CPU-bound)
+                meta_table_path = session_dir / 'meta_table.html'
+                cits_table_path = session_dir / 'cits_table.html'
+
+                await asyncio.gather(
+                    loop.run_in_executor(get_validator_pool(), functools.partial(
+                        _generate_html, str(temp_meta_csv), meta_report_path,
+                        str(meta_table_path), meta_is_valid)),
+                    loop.run_in_executor(get_validator_pool(), functools.partial(
+                        _generate_html, str(temp_cits_csv), cits_report_path,
+                        str(cits_table_path), cits_is_valid))
+                )
 
-            # Generate new HTML using the freshly written report
-            temp_html_path = session_dir / 'temp_revalidate.html'
-            _generate_html(str(temp_csv_path), report_path,
-                           str(temp_html_path), is_valid)
+                # _generate_html already wrote the canonical meta_table.html /
+                # cits_table.html, so the files are not written again — they
+                # are only read back for the baseline snapshots below.
+                new_meta_html, new_cits_html = await asyncio.gather(
+                    _read_text(meta_table_path),
+                    _read_text(cits_table_path)
+                )
 
-            with open(temp_html_path, 'r', encoding='utf-8') as f:
-                new_html = f.read()
+                # Re-merge into the display file (meta_html.html), written in
+                # place by merge_html_files itself.
+                from oc_validator.interface.gui import merge_html_files
+                merged_path = session_dir / 'meta_html.html'
+                await loop.run_in_executor(get_validator_pool(), functools.partial(
+                    merge_html_files, str(meta_table_path),
+                    str(cits_table_path), str(merged_path)))
+
+                # Update baseline snapshots for deletion detection
+                await asyncio.gather(
+                    SessionManager.save_baseline_snapshot(request.session_id, new_meta_html, 'meta'),
+                    SessionManager.save_baseline_snapshot(request.session_id, new_cits_html, 'cits')
+                )
 
-            # Save updated individual HTML (grey highlights intentionally
-            # dropped — re-validation is the canonical "accept and re-check"
-            # action; edited items are no longer specially marked afterwards).
-            await SessionManager.save_html(request.session_id, new_html, table_type)
+                # Update session report paths
+                session.meta_report_path = meta_report_path
+                session.cits_report_path = cits_report_path
 
-            # Update baseline snapshot for deletion detection
-            await SessionManager.save_baseline_snapshot(request.session_id, new_html, table_type)
+                meta_errors, cits_errors = await asyncio.gather(
+                    asyncio.to_thread(load_jsonl_report, meta_report_path),
+                    asyncio.to_thread(load_jsonl_report, cits_report_path)
+                )
+                total_error_count = len(meta_errors) + len(cits_errors)
 
-            # Update session report path
-            if session.has_metadata:
-                session.meta_report_path = report_path
             else:
-                session.cits_report_path = report_path
-
-            total_error_count = len(load_jsonl_report(report_path))
+                # ── Single-table re-validation ──────────────────────────────────
+                table_type = 'meta' if session.has_metadata else 'cits'
+
+                html_content = await SessionManager.load_html(request.session_id, table_type)
+                if not html_content:
+                    raise HTTPException(status_code=404, detail="HTML content not found")
+
+                # Parse the current table data and stream it back out as the
+                # session's scratch CSV in one worker round trip — the session
+                # lock serializes re-validation, so the path (and inode) is
+                # simply reused and truncated on each run.
+                original_csv_path = (session.meta_csv_path if session.has_metadata
+                                      else session.cits_csv_path)
+                temp_csv_path = session_dir / 'scratch_revalidate.csv'
+                try:
+                    row_count = await loop.run_in_executor(
+                        get_validator_pool(), _parse_and_export,
+                        html_content, original_csv_path, str(temp_csv_path)
+                    )
+                except Exception as e:
+                    raise ValueError(f"Failed to parse HTML table: {e}")
+
+                if not row_count:
+                    raise ValueError("No data found in HTML table")
+
+                # Run validation in a worker process — returns (is_valid,
+                # report_path) directly.  The report_path is taken from
+                # validator.output_fp_json, so it is always the file that was
+                # *just* written, regardless of how many previous runs have
+                # created incrementing suffixes in the directory.
+                is_valid, report_path = await loop.run_in_executor(
+                    get_validator_pool(),
+                    functools.partial(
+                        ValidatorService.validate_single,
+                        csv_path=str(temp_csv_path),
+                        output_dir=str(session_dir),
+                        verify_id_existence=verify_id
+                    )
+                )
 
-            # Clean up temp files
-            temp_csv_path.unlink(missing_ok=True)
-            temp_html_path.unlink(missing_ok=True)
+                # Generate new HTML from the freshly written report, straight
+                # into the canonical table file — no scratch HTML plus copy.
+                # (Grey highlights intentionally dropped — re-validation is the
+                # canonical "accept and re-check" action; edited items are no
+                # longer specially marked afterwards.)
+                table_path = session_dir / ('meta_table.html' if session.has_metadata
+                                            else 'cits_table.html')
+                await loop.run_in_executor(get_validator_pool(), functools.partial(
+                    _generate_html, str(temp_csv_path), report_path,
+                    str(table_path), is_valid))
+
+                async with aio_open(table_path, 'r', encoding='utf-8') as f:
+                    new_html = await f.read()
+
+                # Update baseline snapshot for deletion detection
+                await SessionManager.save_baseline_snapshot(request.session_id, new_html, table_type)
+
+                # Update session report path
+                if session.has_metadata:
+                    session.meta_report_path = report_path
+                else:
+                    session.cits_report_path = report_path
+
+                total_error_count = len(
+                    await asyncio.to_thread(load_jsonl_report, report_path)
+                )
 
-        # Mark session as validated (clears has_edits_since_validation)
-        session.mark_validated()
-        session.verify_id_existence = verify_id
-        await SessionManager.save_session(session)
+            # Mark session as validated (clears has_edits_since_validation)
+            session.mark_validated()
+            session.verify_id_existence = verify_id
+            await SessionManager.save_session(session)
 
-        return {
-            "success": True,
-            "error_count": total_error_count,
-            "html_updated": True
-        }
+            return {
+                "success": True,
+                "error_count": total_error_count,
+                "html_updated": True
+            }
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Re-validation failed: {str(e)}")
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.exception("Re-validation failed for session %s", request.session_id)
+            raise HTTPException(status_code=500, detail=f"Re-validation failed: {str(e)}")
 
 
 @router.post("/filtered-rows")
@@ -820,16 +1050,15 @@ async def get_filtered_rows(request: GetFilteredRowsRequest):
         raise HTTPException(status_code=404, detail="Session not found")
 
     table_type = _table_type_for_display(session)
-    html_content = await SessionManager.load_html(request.session_id, table_type)
+    html_content = await SessionManager.materialize_html(request.session_id, table_type)
     if not html_content:
         raise HTTPException(status_code=404, detail="HTML content not found")
 
     row_indices = HTMLParser.get_rows_by_issue(html_content, request.issue_id)
     filtered_html = HTMLParser.extract_filtered_table(html_content, row_indices)
 
-    edit_states = await SessionManager.load_edit_state(request.session_id)
-    if edit_states:
-        edited_ids = [item_id for item_id, state in edit_states.items() if state.edited]
+    edited_ids = await SessionManager.get_edited_ids(request.session_id)
+    if edited_ids:
         filtered_html = HTMLParser.apply_edit_tracking(filtered_html, edited_ids)
 
     return {
@@ -840,12 +1069,20 @@ async def get_filtered_rows(request: GetFilteredRowsRequest):
 
 
 @router.get("/edited/{session_id}")
-async def get_edited_items(session_id: str):
+async def get_edited_items(session_id: str, request: Request, response: Response):
     """Get list of edited items for a session."""
     session = await SessionManager.load_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    # Weak ETag over the backing files; matching If-None-Match skips the
+    # edit-state load and the response serialization entirely.
+    stamps = SessionManager.session_stamp(session_id)
+    etag = f'W/"{abs(hash(stamps)):x}"'
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+
     edit_states = await SessionManager.load_edit_state(session_id)
 
     edited_items = [
@@ -882,7 +1119,7 @@ async def get_deleted_view(session_id: str):
         raise HTTPException(status_code=400, detail="No data files found in session")
 
     # Load current HTML
-    current_html = await SessionManager.load_html(session_id, table_type)
+    current_html = await SessionManager.materialize_html(session_id, table_type)
     if not current_html:
         raise HTTPException(status_code=404, detail="HTML content not found")
 
@@ -925,13 +1162,26 @@ async def get_deleted_view(session_id: str):
 
 
 @router.get("/session/{session_id}")
-async def get_session(session_id: str):
+async def get_session(session_id: str, request: Request, response: Response):
     """Get session information."""
-    session = await SessionManager.load_session(session_id)
+    # Weak ETag over the backing files; matching If-None-Match skips the
+    # loads and the body transfer (see get_html)
+    stamps = SessionManager.session_stamp(session_id)
+    etag = f'W/"{abs(hash(stamps)):x}"'
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+
+    # Session metadata and edit state live in separate files — load both
+    # concurrently
+    session, edit_states = await asyncio.gather(
+        SessionManager.load_session(session_id),
+        SessionManager.load_edit_state(session_id)
+    )
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    edit_states = await SessionManager.load_edit_state(session_id)
     edited_count = sum(1 for state in edit_states.values() if state.edited)
 
     return {
@@ -949,15 +1199,6 @@ async def get_session(session_id: str):
 # Undo / Redo endpoints
 # ---------------------------------------------------------------------------
 
-def _undo_availability(undo_state: dict, table_type: str) -> dict:
-    """Return ``{"can_undo": bool, "can_redo": bool}`` from an undo-state dict."""
-    ts = undo_state.get(table_type, {})
-    return {
-        "can_undo": len(ts.get('undo', [])) > 0,
-        "can_redo": len(ts.get('redo', [])) > 0,
-    }
-
-
 @router.get("/undo_state/{session_id}")
 async def get_undo_state(session_id: str):
     """Return whether undo and redo are currently available for this session."""
@@ -976,27 +1217,53 @@ async def undo(request: UndoRedoRequest):
     Restores the HTML to the state it was in before the most recent edit,
     add-item, delete-row, or clear-cell operation.  The undone state is pushed
     onto the redo stack so it can be re-applied with ``/redo``.
+
+    Pending value edits live in the append-only edit log and are always newer
+    than any structural snapshot (structural mutations compact the log first),
+    so they are undone first by popping the latest log record.
     """
     session = await SessionManager.load_session(request.session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    table_type = 'meta' if session.has_metadata else 'cits'
-    current_html = await SessionManager.load_html(request.session_id, table_type)
-    if not current_html:
-        raise HTTPException(status_code=404, detail="HTML content not found")
+    async with SessionManager.session_lock(request.session_id):
+        table_type = 'meta' if session.has_metadata else 'cits'
 
-    prev_html, undo_state = await SessionManager.pop_undo_snapshot(
-        request.session_id, current_html, table_type
-    )
-    if prev_html is None:
-        return {"success": False, "message": "Nothing to undo", **_undo_availability(undo_state, table_type)}
+        popped = await SessionManager.pop_edit_log_entry(request.session_id)
+        if popped is not None:
+            # Keep per-item tracking in step with the log: the snapshot path
+            # restores edit_state.json wholesale, so the log path must revert
+            # the matching EditState by hand.  The item's value is now the
+            # record's 'old'; the edited flag only stays set while the value
+            # still differs from the original.
+            edit_states = await SessionManager.load_edit_state(request.session_id)
+            state = edit_states.get(popped.get('item_id'))
+            if state is not None:
+                state.edited_value = popped.get('old', '')
+                state.edited = state.edited_value != state.original_value
+                SessionManager.schedule_edit_state_save(request.session_id, edit_states)
+            session.mark_edited()
+            await SessionManager.save_session(session)
+            availability = await SessionManager.get_undo_availability(request.session_id, table_type)
+            return {"success": True, **availability}
+
+        # Log empty → fall back to structural snapshots
+        current_html = await SessionManager.load_html(request.session_id, table_type)
+        if not current_html:
+            raise HTTPException(status_code=404, detail="HTML content not found")
+
+        prev_html, undo_state = await SessionManager.pop_undo_snapshot(
+            request.session_id, current_html, table_type
+        )
+        availability = await SessionManager.get_undo_availability(request.session_id, table_type)
+        if prev_html is None:
+            return {"success": False, "message": "Nothing to undo", **availability}
 
-    await SessionManager.save_html(request.session_id, prev_html, table_type)
-    session.mark_edited()
-    await SessionManager.save_session(session)
+        await SessionManager.save_html(request.session_id, prev_html, table_type)
+        session.mark_edited()
+        await SessionManager.save_session(session)
 
-    return {"success": True, **_undo_availability(undo_state, table_type)}
+        return {"success": True, **availability}
 
 
 @router.post("/redo")
@@ -1006,24 +1273,55 @@ async def redo(request: UndoRedoRequest):
 
     Moves forward in the undo history, restoring the HTML to the state it was
     in after the mutation that was most recently undone.
+
+    Structural redo snapshots are always more recent than undone log records
+    (appending a new edit clears redo snapshots), so they are tried first;
+    otherwise the most recently undone value edit is re-appended to the log.
     """
     session = await SessionManager.load_session(request.session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    table_type = 'meta' if session.has_metadata else 'cits'
-    current_html = await SessionManager.load_html(request.session_id, table_type)
-    if not current_html:
-        raise HTTPException(status_code=404, detail="HTML content not found")
+    async with SessionManager.session_lock(request.session_id):
+        table_type = 'meta' if session.has_metadata else 'cits'
+        current_html = await SessionManager.load_html(request.session_id, table_type)
+        if not current_html:
+            raise HTTPException(status_code=404, detail="HTML content not found")
 
-    next_html, undo_state = await SessionManager.pop_redo_snapshot(
-        request.session_id, current_html, table_type
-    )
-    if next_html is None:
-        return {"success": False, "message": "Nothing to redo", **_undo_availability(undo_state, table_type)}
+        next_html, undo_state = await SessionManager.pop_redo_snapshot(
+            request.session_id, current_html, table_type
+        )
+        if next_html is not None:
+            await SessionManager.save_html(request.session_id, next_html, table_type)
+            session.mark_edited()
+            await SessionManager.save_session(session)
+            availability = await SessionManager.get_undo_availability(request.session_id, table_type)
+            return {"success": True, **availability}
+
+        # No structural snapshot to redo → re-apply an undone value edit
+        reapplied = await SessionManager.pop_redo_log_entry(request.session_id)
+        availability = await SessionManager.get_undo_availability(request.session_id, table_type)
+        if reapplied is None:
+            return {"success": False, "message": "Nothing to redo", **availability}
+
+        # Symmetric to undo: re-applying the record makes the item's value the
+        # record's 'new' again, so the tracked EditState follows suit.
+        item_id = reapplied.get('item_id')
+        edit_states = await SessionManager.load_edit_state(request.session_id)
+        state = edit_states.get(item_id)
+        if state is not None:
+            state.edited_value = reapplied.get('new', '')
+            state.edited = state.edited_value != state.original_value
+        else:
+            edit_states[item_id] = EditState(
+                item_id=item_id,
+                original_value=reapplied.get('old', ''),
+                edited_value=reapplied.get('new', ''),
+                edited=True
+            )
+        SessionManager.schedule_edit_state_save(request.session_id, edit_states)
 
-    await SessionManager.save_html(request.session_id, next_html, table_type)
-    session.mark_edited()
-    await SessionManager.save_session(session)
+        session.mark_edited()
+        await SessionManager.save_session(session)
 
-    return {"success": True, **_undo_availability(undo_state, table_type)}
+        return {"success": True, **availability}
@@ -1,11 +1,13 @@
 """Export operations routes."""
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
-from io import StringIO
 
 from services import SessionManager, HTMLParser, CSVExporter
+from services.validator_service import get_validator_pool
 from models import Session
 
 router = APIRouter()
@@ -41,28 +43,32 @@ async def export_csv(request: ExportRequest):
     # Determine table type for HTML loading
     table_type = 'meta' if session.has_metadata else 'cits'
     
-    # Load current HTML
-    html_content = await SessionManager.load_html(request.session_id, table_type)
+    # Load current HTML (with any pending edit-log records applied)
+    html_content = await SessionManager.materialize_html(request.session_id, table_type)
     
     if not html_content:
         raise HTTPException(status_code=404, detail="HTML content not found")
     
-    # Parse table data from HTML
-    rows_data = HTMLParser.parse_table(html_content)
-    
-    # Generate CSV from parsed data
+    # Parse table data from HTML in a worker process: pure-Python CPU work
+    # that would otherwise stall the event loop for large tables.
+    loop = asyncio.get_running_loop()
+    rows_data = await loop.run_in_executor(
+        get_validator_pool(), HTMLParser.parse_table, html_content
+    )
+
     original_csv_path = session.meta_csv_path if session.has_metadata else session.cits_csv_path
-    csv_content = CSVExporter.rows_to_csv(rows_data, original_csv_path)
-    
+
     # Determine filename
     if session.has_metadata:
         filename_prefix = "metadata"
     else:
         filename_prefix = "citations"
-    
-    # Return CSV as downloadable file
+
+    # Stream the CSV chunk by chunk instead of materializing it: bounded
+    # memory and an immediate first byte for large tables.  Starlette runs
+    # the sync generator in its threadpool, so the loop is not blocked.
     return StreamingResponse(
-        StringIO(csv_content),
+        CSVExporter.iter_csv_chunks(rows_data, original_csv_path),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename={filename_prefix}_edited.csv"
@@ -1,16 +1,113 @@
 """Upload and validation routes."""
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+import asyncio
+import functools
+import logging
+import os
+
+from aiofiles import open as aio_open
+from fastapi import (APIRouter, BackgroundTasks, UploadFile, File, Form,
+                     HTTPException, Request)
 from typing import Optional
 
 from services import ValidatorService, SessionManager
+from services.validator_service import get_validator_pool
 from models import Session
 from config import MAX_UPLOAD_SIZE, DEFAULT_VERIFY_ID_EXISTENCE
 
-# Import oc_validator interface for HTML generation and merging
-from oc_validator.interface.gui import make_gui, merge_html_files
+# oc_validator's interface module is imported lazily inside the handlers that
+# need it so worker startup doesn't pay its import cost before the first upload.
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Copy size for streaming an upload to its destination file.
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _sendfile_copy(out_fd: int, in_fd: int, size: int) -> int:
+    """Copy ``size`` bytes between file descriptors with ``os.sendfile``."""
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+    return offset
+
+
+def _http_413(filename: str) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"{filename} exceeds maximum size of {MAX_UPLOAD_SIZE / (1024*1024)} MB"
+    )
+
+
+async def _save_upload_stream(session_dir, upload: UploadFile, filename: str):
+    """
+    Save an uploaded file into ``session_dir / filename``.
+
+    Uploads large enough that Starlette's spool has already rolled to a
+    temporary file are copied kernel-to-kernel with ``os.sendfile`` — no
+    chunk ever crosses into userspace, and the size limit is checked against
+    the spool's stat before any byte moves.  Smaller (in-memory) uploads are
+    streamed in 1 MiB chunks, with the byte count enforced mid-copy so an
+    oversize stream is cut off: the partial file is removed and a 413 raised.
+
+    Returns:
+        Tuple of (destination path, bytes written).
+    """
+    file_path = session_dir / filename
+
+    spool = upload.file
+    if getattr(spool, '_rolled', False):
+        size = os.fstat(spool.fileno()).st_size
+        if size > MAX_UPLOAD_SIZE:
+            raise _http_413(filename)
+        with open(file_path, 'wb') as out:
+            written = await asyncio.to_thread(
+                _sendfile_copy, out.fileno(), spool.fileno(), size)
+        return file_path, written
+
+    bytes_written = 0
+    too_large = False
+    async with aio_open(file_path, 'wb') as f:
+        while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+            bytes_written += len(chunk)
+            if bytes_written > MAX_UPLOAD_SIZE:
+                too_large = True
+                break
+            await f.write(chunk)
+    if too_large:
+        file_path.unlink(missing_ok=True)
+        raise _http_413(filename)
+    return file_path, bytes_written
+
+
+async def _persist_upload(session_dir, upload: UploadFile,
+                          default_name: str, label: str):
+    """
+    Save one uploaded CSV into the session directory and reject empty files.
+
+    Wraps ``_save_upload_stream`` with the filename-or-default and
+    empty-content checks that the metadata and citations branches would
+    otherwise duplicate.
+
+    Returns:
+        Destination path of the saved file.
+    """
+    filename = upload.filename or default_name
+    file_path, size = await _save_upload_stream(session_dir, upload, filename)
+    if not size:
+        raise HTTPException(status_code=400, detail=f"{label} file is empty.")
+    return file_path
+
+
+async def _read_text(path) -> str:
+    """Read a text file asynchronously (gather-friendly helper)."""
+    async with aio_open(path, 'r', encoding='utf-8') as f:
+        return await f.read()
+
 
 def _generate_html(csv_fp: str, report_fp: str, out_fp: str, is_valid: bool) -> None:
     """
@@ -31,11 +128,14 @@ def _generate_html(csv_fp: str, report_fp: str, out_fp: str, is_valid: bool) ->
     if is_valid:
         ValidatorService._make_no_errors_html(out_fp, csv_fp)
     else:
+        from oc_validator.interface.gui import make_gui
         make_gui(csv_fp, report_fp, out_fp)
 
 
 @router.post("/")
 async def upload_files(
+    request: Request,
+    background_tasks: BackgroundTasks,
     metadata_file: Optional[UploadFile] = File(None),
     citations_file: Optional[UploadFile] = File(None),
     verify_id_existence: bool = Form(DEFAULT_VERIFY_ID_EXISTENCE)
@@ -48,32 +148,21 @@ async def upload_files(
     - **verify_id_existence**: Whether to check ID existence (external APIs)
     """
     # ── file-size checks ──────────────────────────────────────────────────────
-    has_metadata = False
-    has_citations = False
-
-    if metadata_file:
-        metadata_file.file.seek(0, 2)
-        size = metadata_file.file.tell()
-        metadata_file.file.seek(0)
-        if size > 0 and size <= MAX_UPLOAD_SIZE:
-            has_metadata = True
-        elif size > MAX_UPLOAD_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Metadata file exceeds maximum size of {MAX_UPLOAD_SIZE / (1024*1024)} MB"
-            )
-
-    if citations_file:
-        citations_file.file.seek(0, 2)
-        size = citations_file.file.tell()
-        citations_file.file.seek(0)
-        if size > 0 and size <= MAX_UPLOAD_SIZE:
-            has_citations = True
-        elif size > MAX_UPLOAD_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Citations file exceeds maximum size of {MAX_UPLOAD_SIZE / (1024*1024)} MB"
-            )
+    # Cheap early reject on the declared body size; the real per-file limit is
+    # enforced byte-for-byte during the streamed copy below.  The slack covers
+    # the second file and the multipart framing.
+    content_length = request.headers.get('content-length')
+    if content_length and content_length.isdigit() and \
+            int(content_length) > 2 * MAX_UPLOAD_SIZE + (1 << 20):
+        raise HTTPException(
+            status_code=413,
+            detail=f"Upload exceeds maximum size of {MAX_UPLOAD_SIZE / (1024*1024)} MB per file"
+        )
+
+    # A browser form with no file chosen still submits an empty part, so
+    # presence means "has a filename"; empty files are caught after the copy.
+    has_metadata = bool(metadata_file and metadata_file.filename)
+    has_citations = bool(citations_file and citations_file.filename)
 
     if not has_metadata and not has_citations:
         raise HTTPException(status_code=400, detail="At least one CSV file must be provided")
@@ -90,33 +179,35 @@ async def upload_files(
     )
 
     # ── save uploaded files ───────────────────────────────────────────────────
+    # Streamed/sendfile-copied: the whole file never lives in this process's
+    # memory.
     if has_metadata:
-        filename = metadata_file.filename or 'metadata.csv'
-        meta_content = await metadata_file.read()
-        if not meta_content:
-            raise HTTPException(status_code=400, detail="Metadata file is empty.")
-        meta_path = await SessionManager.save_uploaded_file(session_id, meta_content, filename)
-        session.meta_csv_path = meta_path
+        session.meta_csv_path = str(await _persist_upload(
+            session_dir, metadata_file, 'metadata.csv', 'Metadata'))
 
     if has_citations:
-        filename = citations_file.filename or 'citations.csv'
-        cits_content = await citations_file.read()
-        if not cits_content:
-            raise HTTPException(status_code=400, detail="Citations file is empty.")
-        cits_path = await SessionManager.save_uploaded_file(session_id, cits_content, filename)
-        session.cits_csv_path = cits_path
+        session.cits_csv_path = str(await _persist_upload(
+            session_dir, citations_file, 'citations.csv', 'Citations'))
 
     # ── validation + HTML generation ──────────────────────────────────────────
+    # Validation and HTML generation are sync, CPU-bound Python; running them
+    # on the event loop (or even a thread, given the GIL) would stall every
+    # other request for the duration, so they go to the validator worker pool.
+    loop = asyncio.get_running_loop()
     try:
         if has_metadata and has_citations:
             # ── Paired validation via ClosureValidator ──────────────────────
             meta_is_valid, cits_is_valid, meta_report_path, cits_report_path = \
-                ValidatorService.validate_pair(
-                    meta_csv_path=session.meta_csv_path,
-                    cits_csv_path=session.cits_csv_path,
-                    meta_output_dir=str(session_dir),
-                    cits_output_dir=str(session_dir),
-                    verify_id_existence=verify_id_existence
+                await loop.run_in_executor(
+                    get_validator_pool(),
+                    functools.partial(
+                        ValidatorService.validate_pair,
+                        meta_csv_path=session.meta_csv_path,
+                        cits_csv_path=session.cits_csv_path,
+                        meta_output_dir=str(session_dir),
+                        cits_output_dir=str(session_dir),
+                        verify_id_existence=verify_id_existence
+                    )
                 )
 
             session.meta_report_path = meta_report_path
@@ -127,82 +218,101 @@ async def upload_files(
             meta_table_path = session_dir / 'meta_table.html'
             cits_table_path = session_dir / 'cits_table.html'
 
-            _generate_html(session.meta_csv_path, meta_report_path,
-                            str(meta_table_path), meta_is_valid)
-            _generate_html(session.cits_csv_path, cits_report_path,
-                            str(cits_table_path), cits_is_valid)
-
-            # Save individual tables through session manager (meta_table.html,
-            # cits_table.html) so that re-validation can parse them later.
-            with open(meta_table_path, 'r', encoding='utf-8') as f:
-                meta_html_content = f.read()
-            with open(cits_table_path, 'r', encoding='utf-8') as f:
-                cits_html_content = f.read()
+            await asyncio.gather(
+                loop.run_in_executor(get_validator_pool(), functools.partial(
+                    _generate_html, session.meta_csv_path, meta_report_path,
+                    str(meta_table_path), meta_is_valid)),
+                loop.run_in_executor(get_validator_pool(), functools.partial(
+                    _generate_html, session.cits_csv_path, cits_report_path,
+                    str(cits_table_path), cits_is_valid))
+            )
 
-            await SessionManager.save_html(session_id, meta_html_content, 'meta')
-            await SessionManager.save_html(session_id, cits_html_content, 'cits')
+            # _generate_html already wrote the canonical meta_table.html /
+            # cits_table.html, so the files are not written again — they are
+            # only read back (concurrently) for the baseline snapshots below.
+            meta_html_content, cits_html_content = await asyncio.gather(
+                _read_text(meta_table_path),
+                _read_text(cits_table_path)
+            )
 
-            # Merge the two individual HTMLs into a single display file
-            # (meta_html.html, table_type='display').
+            # Merge the two individual HTMLs into the display file
+            # (meta_html.html, table_type='display'), written in place by
+            # merge_html_files itself.
+            from oc_validator.interface.gui import merge_html_files
             merged_path = session_dir / 'meta_html.html'
-            merge_html_files(str(meta_table_path), str(cits_table_path),
-                             str(merged_path))
-            with open(merged_path, 'r', encoding='utf-8') as f:
-                merged_content = f.read()
-            await SessionManager.save_html(session_id, merged_content, 'display')
+            await loop.run_in_executor(get_validator_pool(), functools.partial(
+                merge_html_files, str(meta_table_path), str(cits_table_path),
+                str(merged_path)))
 
             session.meta_html_path = str(meta_table_path)
             session.cits_html_path = str(cits_table_path)
 
-            # Save baseline snapshots for deletion detection
-            await SessionManager.save_baseline_snapshot(session_id, meta_html_content, 'meta')
-            await SessionManager.save_baseline_snapshot(session_id, cits_html_content, 'cits')
+            # Baseline snapshots only feed later deleted-view diffs, so their
+            # compression and writes happen after the response is sent.
+            background_tasks.add_task(
+                SessionManager.save_baseline_snapshot, session_id, meta_html_content, 'meta')
+            background_tasks.add_task(
+                SessionManager.save_baseline_snapshot, session_id, cits_html_content, 'cits')
 
         elif has_metadata:
             # ── Single metadata table ───────────────────────────────────────
-            meta_is_valid, meta_report_path = ValidatorService.validate_metadata(
-                csv_path=session.meta_csv_path,
-                output_dir=str(session_dir),
-                verify_id_existence=verify_id_existence
+            meta_is_valid, meta_report_path = await loop.run_in_executor(
+                get_validator_pool(),
+                functools.partial(
+                    ValidatorService.validate_metadata,
+                    csv_path=session.meta_csv_path,
+                    output_dir=str(session_dir),
+                    verify_id_existence=verify_id_existence
+                )
             )
 
             session.meta_report_path = meta_report_path
 
             meta_table_path = session_dir / 'meta_table.html'
-            _generate_html(session.meta_csv_path, meta_report_path,
-                            str(meta_table_path), meta_is_valid)
+            await loop.run_in_executor(get_validator_pool(), functools.partial(
+                _generate_html, session.meta_csv_path, meta_report_path,
+                str(meta_table_path), meta_is_valid))
 
-            with open(meta_table_path, 'r', encoding='utf-8') as f:
-                meta_html_content = f.read()
-            await SessionManager.save_html(session_id, meta_html_content, 'meta')
+            # _generate_html wrote the canonical meta_table.html directly; the
+            # read-back only feeds the baseline snapshot.
+            meta_html_content = await _read_text(meta_table_path)
 
             session.meta_html_path = str(meta_table_path)
 
-            # Save baseline snapshot for deletion detection
-            await SessionManager.save_baseline_snapshot(session_id, meta_html_content, 'meta')
+            # Baseline snapshot only feeds later deleted-view diffs, so its
+            # compression and write happen after the response is sent.
+            background_tasks.add_task(
+                SessionManager.save_baseline_snapshot, session_id, meta_html_content, 'meta')
 
         elif has_citations:
             # ── Single citations table ──────────────────────────────────────
-            cits_is_valid, cits_report_path = ValidatorService.validate_citations(
-                csv_path=session.cits_csv_path,
-                output_dir=str(session_dir),
-                verify_id_existence=verify_id_existence
+            cits_is_valid, cits_report_path = await loop.run_in_executor(
+                get_validator_pool(),
+                functools.partial(
+                    ValidatorService.validate_citations,
+                    csv_path=session.cits_csv_path,
+                    output_dir=str(session_dir),
+                    verify_id_existence=verify_id_existence
+                )
             )
 
             session.cits_report_path = cits_report_path
 
             cits_table_path = session_dir / 'cits_table.html'
-            _generate_html(session.cits_csv_path, cits_report_path,
-                            str(cits_table_path), cits_is_valid)
+            await loop.run_in_executor(get_validator_pool(), functools.partial(
+                _generate_html, session.cits_csv_path, cits_report_path,
+                str(cits_table_path), cits_is_valid))
 
-            with open(cits_table_path, 'r', encoding='utf-8') as f:
-                cits_html_content = f.read()
-            await SessionManager.save_html(session_id, cits_html_content, 'cits')
+            # _generate_html wrote the canonical cits_table.html directly; the
+            # read-back only feeds the baseline snapshot.
+            cits_html_content = await _read_text(cits_table_path)
 
             session.cits_html_path = str(cits_table_path)
 
-            # Save baseline snapshot for deletion detection
-            await SessionManager.save_baseline_snapshot(session_id, cits_html_content, 'cits')
+            # Baseline snapshot only feeds later deleted-view diffs, so its
+            # compression and write happen after the response is sent.
+            background_tasks.add_task(
+                SessionManager.save_baseline_snapshot, session_id, cits_html_content, 'cits')
 
         # Mark as validated and persist session
         session.mark_validated()
@@ -218,8 +328,7 @@ async def upload_files(
 
     except ValueError as e:
         SessionManager.delete_session(session_id)
-        import traceback
-        traceback.print_exc()
+        logger.exception("Upload validation failed for session %s", session_id)
         error_msg = str(e)
         if "delimiter" in error_msg.lower():
             raise HTTPException(
@@ -232,6 +341,5 @@ async def upload_files(
         raise
     except Exception as e:
         SessionManager.delete_session(session_id)
-        import traceback
-        traceback.print_exc()
+        logger.exception("Upload failed for session %s", session_id)
         raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
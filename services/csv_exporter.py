@@ -1,8 +1,79 @@
 """Service for exporting HTML table data back to CSV format."""
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import csv
+import os
 from io import StringIO
-from oc_validator.helper import read_csv
+
+# Header/delimiter of the original CSV, keyed by path and cached by file
+# stamp: the original upload never changes between re-validations, so the
+# full-file parse it used to take per export is paid at most once.
+_HEADER_CACHE: Dict[str, Tuple[tuple, List[str], str]] = {}
+
+# Multi-value field categories.  Hoisted to module scope so the per-cell
+# membership tests don't rebuild a list literal on every cell.
+_SPACE_FIELDS = frozenset({'citing_id', 'cited_id', 'id'})
+_SEMI_FIELDS = frozenset({'author', 'publisher', 'editor'})
+
+
+def _join_space(items: List[str]) -> str:
+    """Join space-separated IDs, dropping blanks from emptied containers."""
+    return ' '.join(i for i in items if i.strip())
+
+
+def _join_semi(items: List[str]) -> str:
+    """Join semicolon-separated agents, dropping blanks."""
+    return '; '.join(i for i in items if i.strip())
+
+
+def _first(items: List[str]) -> str:
+    """Single-value field: take the first item, or empty."""
+    return items[0] if items else ''
+
+
+def _sniff_delimiter(sample: str) -> str:
+    """
+    Detect the delimiter of a CSV sample.
+
+    Tries ``csv.Sniffer`` first (quote-aware, so a comma inside a quoted
+    header field no longer wins over the real semicolon/tab delimiter).
+    When the sniffer can't decide, falls back to a per-line count vote:
+    among candidates that appear on every sampled line, pick the one whose
+    per-line count is the most uniform (a real delimiter occurs a constant
+    number of times per record).
+    """
+    candidates = (',', ';', '\t', '|')
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=''.join(candidates)).delimiter
+    except csv.Error:
+        pass
+
+    lines = [ln for ln in sample.splitlines() if ln.strip()][:50]
+    best, best_key = ',', None
+    for cand in candidates:
+        counts = [ln.count(cand) for ln in lines]
+        if not counts or min(counts) == 0:
+            continue
+        mean = sum(counts) / len(counts)
+        variance = sum((c - mean) ** 2 for c in counts) / len(counts)
+        key = (variance, -mean)
+        if best_key is None or key < best_key:
+            best, best_key = cand, key
+    return best
+
+
+def _field_joiners(fieldnames: List[str]) -> List[Tuple[str, Callable[[List[str]], str]]]:
+    """
+    Resolve each field's join function once, before the row loop.
+
+    Returns ``[(field, joiner), ...]`` in header order, so building a row is
+    a single comprehension with no per-cell category dispatch.
+    """
+    return [
+        (f, _join_space if f in _SPACE_FIELDS
+            else _join_semi if f in _SEMI_FIELDS
+            else _first)
+        for f in fieldnames
+    ]
 
 
 class CSVExporter:
@@ -32,28 +103,20 @@ class CSVExporter:
         delimiter = ','
         
         output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames, delimiter=delimiter)
-        
-        writer.writeheader()
-        
-        for row in rows_data:
-            # Join items with appropriate separator.
-            # Filter out blank items first so that emptied item-containers
-            # (e.g. user deleted a value) do not leave stray separators.
-            csv_row = {}
-            for field, items in row.items():
-                if field in ['citing_id', 'cited_id', 'id']:
-                    # Space-separated IDs
-                    csv_row[field] = ' '.join(i for i in items if i.strip())
-                elif field in ['author', 'publisher', 'editor']:
-                    # Semicolon-separated agents
-                    csv_row[field] = '; '.join(i for i in items if i.strip())
-                else:
-                    # Single value fields
-                    csv_row[field] = items[0] if items else ''
-            
-            writer.writerow(csv_row)
-        
+        writer = csv.writer(output, delimiter=delimiter)
+        writer.writerow(fieldnames)
+
+        # Join items with appropriate separator.  Blank items are filtered
+        # out (inside the joiners) so that emptied item-containers do not
+        # leave stray separators; the join function per field is resolved
+        # once here rather than re-dispatched per cell, and rows go to the
+        # writer as lists in header order — no per-row dict→column lookup.
+        joiners = _field_joiners(fieldnames)
+        writer.writerows(
+            [join(row.get(field, [])) for field, join in joiners]
+            for row in rows_data
+        )
+
         return output.getvalue()
     
     @staticmethod
@@ -65,77 +128,159 @@ class CSVExporter:
             csv_content: CSV string content
             
         Returns:
-            Detected delimiter (comma, semicolon, or tab)
+            Detected delimiter (comma, semicolon, tab or pipe)
         """
-        # Try to detect delimiter
-        for delimiter in [',', ';', '\t']:
-            # Read first line and count delimiter occurrences
-            first_line = csv_content.split('\n')[0]
-            if first_line.count(delimiter) >= 1:
-                return delimiter
-        
-        # Default to comma
-        return ','
+        return _sniff_delimiter(csv_content[:65536])
     
+    @staticmethod
+    def _read_header(original_csv_path: str) -> Optional[Tuple[List[str], str]]:
+        """
+        Return ``(fieldnames, delimiter)`` of the original CSV, cached by the
+        file's mtime/size so repeated exports only read the first line once.
+
+        Args:
+            original_csv_path: Path to the originally uploaded CSV file
+
+        Returns:
+            ``(fieldnames, delimiter)`` or None if the file is missing/empty.
+        """
+        try:
+            st = os.stat(original_csv_path)
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        cached = _HEADER_CACHE.get(original_csv_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+
+        # A 64 KiB sample (not just the header line) gives the sniffer's
+        # quote-aware detection and the count vote real data rows to work
+        # with; the first-line max-count heuristic it replaces picked ','
+        # whenever a quoted field contained one.
+        with open(original_csv_path, 'r', encoding='utf-8') as f:
+            sample = f.read(65536)
+        if not sample.strip():
+            return None
+
+        delimiter = _sniff_delimiter(sample)
+        fieldnames = next(csv.reader([sample.splitlines()[0]], delimiter=delimiter))
+
+        _HEADER_CACHE[original_csv_path] = (stamp, fieldnames, delimiter)
+        return fieldnames, delimiter
+
     @staticmethod
     def rows_to_csv(rows_data: List[Dict[str, List[str]]], original_csv_path: str) -> str:
         """
-        Generate CSV string using delimiter from original file.
-        
+        Generate CSV string using the header and delimiter of the original file.
+
         Args:
             rows_data: List of dictionaries with field names as keys
                       and lists of items as values
             original_csv_path: Path to original CSV file to detect delimiter
-            
+
         Returns:
             CSV string
         """
         if not rows_data:
             return ""
-        
-        # Read original file to detect delimiter
-        from oc_validator.helper import read_csv
-        original_data = read_csv(original_csv_path)
-        
-        if not original_data:
+
+        header = CSVExporter._read_header(original_csv_path)
+        if header is None:
             # Fallback to default
             return CSVExporter.generate_csv(rows_data, 'meta')
-        
-        # Get delimiter from original file
-        first_row_keys = list(original_data[0].keys())
-        fieldnames = first_row_keys
-        
-        # Determine delimiter by checking file content
-        with open(original_csv_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline()
-            for delimiter in [',', ';', '\t']:
-                if first_line.count(delimiter) >= len(fieldnames) - 1:
-                    break
-            else:
-                delimiter = ','
-        
-        output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames, delimiter=delimiter)
-        
-        writer.writeheader()
-        
-        for row in rows_data:
-            # Join items with appropriate separator.
-            # Filter out blank items first so that emptied item-containers
-            # do not leave stray separators in the exported CSV.
-            csv_row = {}
-            for field in fieldnames:
-                items = row.get(field, [])
-                if field in ['citing_id', 'cited_id', 'id']:
-                    # Space-separated IDs
-                    csv_row[field] = ' '.join(i for i in items if i.strip())
-                elif field in ['author', 'publisher', 'editor']:
-                    # Semicolon-separated agents
-                    csv_row[field] = '; '.join(i for i in items if i.strip())
-                else:
-                    # Single value fields
-                    csv_row[field] = items[0] if items else ''
-            
-            writer.writerow(csv_row)
-        
-        return output.getvalue()
\ No newline at end of file
+
+        return ''.join(CSVExporter.iter_csv_chunks(rows_data, original_csv_path))
+
+    @staticmethod
+    def _build_row(fieldnames: List[str], row: Dict[str, List[str]]) -> List[str]:
+        """
+        Join a parsed row's items into CSV cell values in header order.
+
+        Blank items are filtered out first so that emptied item-containers do
+        not leave stray separators in the exported CSV.  Callers with a row
+        loop should resolve ``_field_joiners`` once themselves instead.
+        """
+        return [join(row.get(field, [])) for field, join in _field_joiners(fieldnames)]
+
+    @staticmethod
+    def write_csv_file(
+        rows_data: List[Dict[str, List[str]]],
+        original_csv_path: str,
+        out_path: str
+    ) -> None:
+        """
+        Write the CSV for ``rows_data`` directly to ``out_path``.
+
+        Streams rows through ``csv.writer`` into the open file instead of
+        materializing the whole document as one string first, so peak memory
+        stays at one row — and when this runs in a worker process, no giant
+        string has to be pickled back to the caller just to be written out.
+
+        Args:
+            rows_data:         List of dictionaries with field names as keys
+                               and lists of items as values
+            original_csv_path: Path to original CSV file to detect delimiter
+            out_path:          Destination path for the generated CSV
+        """
+        header = CSVExporter._read_header(original_csv_path)
+        if header is None:
+            fieldnames = list(rows_data[0].keys()) if rows_data else []
+            delimiter = ','
+        else:
+            fieldnames, delimiter = header
+
+        joiners = _field_joiners(fieldnames)
+        with open(out_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, delimiter=delimiter)
+            writer.writerow(fieldnames)
+            # writerows amortizes the writer-call overhead across the whole
+            # table; the generator keeps peak memory at one built row.
+            writer.writerows(
+                [join(row.get(field, [])) for field, join in joiners]
+                for row in rows_data
+            )
+
+    @staticmethod
+    def iter_csv_chunks(
+        rows_data: List[Dict[str, List[str]]],
+        original_csv_path: str,
+        rows_per_chunk: int = 500
+    ) -> Iterator[str]:
+        """
+        Yield the CSV for ``rows_data`` as string chunks of ``rows_per_chunk``
+        rows (header included in the first chunk).
+
+        Lets the export endpoint stream large tables with bounded memory and
+        an immediate first byte instead of materializing the whole document.
+
+        Args:
+            rows_data:         List of dictionaries with field names as keys
+                               and lists of items as values
+            original_csv_path: Path to original CSV file to detect delimiter
+            rows_per_chunk:    Number of data rows per yielded chunk
+        """
+        if not rows_data:
+            return
+
+        header = CSVExporter._read_header(original_csv_path)
+        if header is None:
+            fieldnames = list(rows_data[0].keys())
+            delimiter = ','
+        else:
+            fieldnames, delimiter = header
+
+        joiners = _field_joiners(fieldnames)
+        buf = StringIO()
+        writer = csv.writer(buf, delimiter=delimiter)
+        writer.writerow(fieldnames)
+
+        # One writerows call per chunk instead of a writer call per row.
+        for start in range(0, len(rows_data), rows_per_chunk):
+            writer.writerows(
+                [join(row.get(field, [])) for field, join in joiners]
+                for row in rows_data[start:start + rows_per_chunk]
+            )
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
\ No newline at end of file
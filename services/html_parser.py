@@ -1,13 +1,56 @@
 """Service for parsing HTML and extracting table data."""
-from bs4 import BeautifulSoup, PageElement, Tag
-from typing import Dict, List, Optional
+from bs4 import BeautifulSoup, PageElement, SoupStrainer, Tag
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
 import csv
+import hashlib
 from io import StringIO
 
+# BeautifulSoup backend for document parses.  lxml parses at C speed —
+# roughly an order of magnitude faster than the pure-Python 'html.parser' on
+# these table documents — and builds the same tree for them.  Unlike
+# 'html.parser' it wraps fragment inputs in <html><body> scaffolding, so
+# helpers that accept fragments (the tracking passes, which also get the
+# filtered-rows <table> fragment) serialize through _serialize_like_input
+# to strip the wrapper again.
+try:
+    import lxml.html
+    from lxml import etree
+    _DOC_PARSER = 'lxml'
+    # Compiled XPath expressions for the raw-lxml fast path of parse_table —
+    # compiled once, they traverse in C without building bs4's Python-object
+    # tree at all.
+    _XP_TABLE = etree.XPath("//table[@id='table-data']")
+    _XP_HEADERS = etree.XPath("./thead//tr[1]/th")
+    _XP_ROWS = etree.XPath("./tbody/tr")
+    _XP_CELLS = etree.XPath("./td")
+    _XP_ITEMS = etree.XPath(
+        ".//span[contains(concat(' ', normalize-space(@class), ' '), ' item-data ')]"
+    )
+except ImportError:
+    _DOC_PARSER = 'html.parser'
+
+# Read-only helpers only ever look inside <table id="table-data">, so they
+# restrict parsing to that subtree: the page chrome around it (head, scripts,
+# issue panels) never becomes tree nodes.  Mutating methods must keep parsing
+# the whole document, since they re-serialize it in full.
+_TABLE_STRAINER = SoupStrainer('table', id='table-data')
+
 
 class HTMLParser:
     """Parse HTML tables and extract data."""
-    
+
+    # Memoized results of repeated whole-document passes (the tracking
+    # passes and the issue-filter path).  All of them walk the full document
+    # with BeautifulSoup, and between edits the editor repeats them on
+    # identical inputs.  Keys are (operation, content digest, operation args);
+    # content-keyed entries need no explicit invalidation, LRU eviction bounds
+    # the memory.  The digest is a real cryptographic hash, not built-in
+    # hash(): the cache is shared across sessions, so a 64-bit salted-hash
+    # collision would silently serve one session's HTML to another.
+    _memo_cache: "OrderedDict[tuple, object]" = OrderedDict()
+    _MEMO_CACHE_MAX = 128
+
     # Item separators for different field types
     ITEM_SEPARATORS = {
         'citing_id': ' ',
@@ -17,7 +60,49 @@ class HTMLParser:
         'publisher': '; ',
         'editor': '; '
     }
-    
+
+    @staticmethod
+    def _content_key(html_content: str) -> bytes:
+        """Collision-safe cache key for a document's content."""
+        return hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).digest()
+
+    @staticmethod
+    def _serialize_like_input(soup: BeautifulSoup, html_content: str) -> str:
+        """
+        Serialize ``soup`` with the same document shape as the input.
+
+        lxml wraps fragment inputs (e.g. the bare ``<table>`` the
+        filtered-rows path passes through the tracking helpers) in
+        ``<html><body>`` scaffolding; when the input was such a fragment,
+        return the body's children instead of the wrapper so the output
+        shape matches what was passed in.
+        """
+        if _DOC_PARSER != 'lxml':
+            return str(soup)
+        head = html_content.lstrip()[:9].lower()
+        if head.startswith('<!doctype') or head.startswith('<html'):
+            return str(soup)
+        body = soup.body
+        if body is None:
+            return str(soup)
+        return ''.join(str(child) for child in body.children)
+
+    @staticmethod
+    def _memo_get(key: tuple):
+        """Return a memoized result, refreshing its LRU position."""
+        cached = HTMLParser._memo_cache.get(key)
+        if cached is not None:
+            HTMLParser._memo_cache.move_to_end(key)
+        return cached
+
+    @staticmethod
+    def _memo_put(key: tuple, value) -> None:
+        """Store a memoized result, evicting the oldest entries beyond the cap."""
+        HTMLParser._memo_cache[key] = value
+        HTMLParser._memo_cache.move_to_end(key)
+        while len(HTMLParser._memo_cache) > HTMLParser._MEMO_CACHE_MAX:
+            HTMLParser._memo_cache.popitem(last=False)
+
     @staticmethod
     def parse_table(html_content: str) -> List[Dict[str, List[str]]]:
         """
@@ -30,7 +115,10 @@ class HTMLParser:
             List of dictionaries, where each dict represents a row
             with field names as keys and lists of items as values
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if _DOC_PARSER == 'lxml':
+            return HTMLParser._parse_table_lxml(html_content)
+
+        soup = BeautifulSoup(html_content, _DOC_PARSER, parse_only=_TABLE_STRAINER)
         table = soup.find('table', id='table-data')
         
         if not table:
@@ -72,9 +160,53 @@ class HTMLParser:
                 row_data[header] = items
             
             rows_data.append(row_data)
-        
+
         return rows_data
-    
+
+    @staticmethod
+    def _parse_table_lxml(html_content: str) -> List[Dict[str, List[str]]]:
+        """
+        Raw-lxml implementation of ``parse_table``.
+
+        Uses ``lxml.html.fromstring`` plus the precompiled XPath expressions,
+        so both parsing and traversal stay in C — no per-node Python objects
+        are built the way BeautifulSoup does.  Read-only: it produces the same
+        row dictionaries as the soup-based path and never serializes HTML.
+        """
+        root = lxml.html.fromstring(html_content)
+        tables = _XP_TABLE(root)
+        if not tables:
+            raise ValueError("Table with id 'table-data' not found in HTML")
+        table = tables[0]
+
+        # Skip first header (row number)
+        headers = [th.text_content().strip() for th in _XP_HEADERS(table)][1:]
+
+        rows_data = []
+        for row in _XP_ROWS(table):
+            # Skip first cell (row number)
+            cells = _XP_CELLS(row)[1:]
+
+            row_data = {}
+            for header, cell in zip(headers, cells):
+                item_spans = _XP_ITEMS(cell)
+
+                # Blank items from emptied item-containers are filtered out so
+                # that the CSV exporter does not generate stray separators.
+                items = [t for t in (s.text_content() for s in item_spans)
+                         if t.strip()]
+
+                # If no item-data spans found, or all items were blank, fall
+                # back to a single empty string (valid empty-cell CSV).
+                if not items:
+                    items = [cell.text_content() if not item_spans else '']
+
+                row_data[header] = items
+
+            rows_data.append(row_data)
+
+        return rows_data
+
     @staticmethod
     def get_rows_by_issue(html_content: str, issue_id: str) -> List[int]:
         """
@@ -87,12 +219,17 @@ class HTMLParser:
         Returns:
             List of row indices (0-based)
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        cache_key = ('issue-rows', HTMLParser._content_key(html_content), issue_id)
+        cached = HTMLParser._memo_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        soup = BeautifulSoup(html_content, _DOC_PARSER, parse_only=_TABLE_STRAINER)
         table = soup.find('table', id='table-data')
-        
+
         if not table:
             raise ValueError("Table with id 'table-data' not found in HTML")
-        
+
         # Find all issue icons with the given issue_id
         issue_icons = table.find_all('span', class_='issue-icon', id=issue_id)
         
@@ -109,8 +246,10 @@ class HTMLParser:
                         row_indices.add(row_idx)
                     except ValueError:
                         pass
-        
-        return sorted(list(row_indices))
+
+        result = sorted(row_indices)
+        HTMLParser._memo_put(cache_key, result)
+        return list(result)
     
     @staticmethod
     def extract_filtered_table(html_content: str, row_indices: List[int]) -> str:
@@ -124,9 +263,12 @@ class HTMLParser:
         Returns:
             HTML string containing the filtered table
         """
-        from copy import copy as shallow_copy
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
+        cache_key = ('filtered', HTMLParser._content_key(html_content), tuple(row_indices))
+        cached = HTMLParser._memo_get(cache_key)
+        if cached is not None:
+            return cached
+
+        soup = BeautifulSoup(html_content, _DOC_PARSER, parse_only=_TABLE_STRAINER)
         table = soup.find('table', id='table-data')
         
         if not table:
@@ -138,34 +280,28 @@ class HTMLParser:
             class_attr = ' '.join(table_class)
         else:
             class_attr = table_class
-        
-        # Create a new table
-        new_table = soup.new_tag('table', attrs={'class': class_attr, 'id': 'table-data'})
-        
-        # Copy header using BeautifulSoup's decode/encode pattern for deep copy
+
+        # The filtered table only needs to exist as a string, so instead of
+        # deep-copying subtrees into a new soup (which used to re-parse every
+        # kept row's HTML), serialize the header and the kept rows once and
+        # concatenate them into a fresh <table> wrapper directly.
         thead = table.find('thead')
-        if thead:
-            # Parse the thead HTML to create a fresh copy
-            thead_soup = BeautifulSoup(str(thead), 'html.parser')
-            new_table.append(thead_soup.find('thead'))
-        
-        # Copy only specified rows
+        thead_html = str(thead) if thead else ''
+
         tbody = table.find('tbody')
-        new_tbody = soup.new_tag('tbody')
-        
         row_index_set = set(row_indices)
-        row_idx = 0
-        
-        for row in tbody.find_all('tr'):
-            if row_idx in row_index_set:
-                # Parse the row HTML to create a fresh copy
-                row_soup = BeautifulSoup(str(row), 'html.parser')
-                new_tbody.append(row_soup.find('tr'))
-            row_idx += 1
-        
-        new_table.append(new_tbody)
-        
-        return str(new_table)
+        rows_html = ''.join(
+            str(row)
+            for row_idx, row in enumerate(tbody.find_all('tr'))
+            if row_idx in row_index_set
+        )
+
+        result = (
+            f'<table class="{class_attr}" id="table-data">'
+            f'{thead_html}<tbody>{rows_html}</tbody></table>'
+        )
+        HTMLParser._memo_put(cache_key, result)
+        return result
     
     @staticmethod
     def get_field_data_by_item_id(html_content: str, item_id: str) -> Optional[str]:
@@ -180,7 +316,7 @@ class HTMLParser:
         Returns:
             Current text value or None if not found
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER, parse_only=_TABLE_STRAINER)
         container = soup.find('span', id=item_id)
         
         if not container:
@@ -193,6 +329,30 @@ class HTMLParser:
         
         return None
     
+    @staticmethod
+    def build_item_value_index(html_content: str) -> Dict[str, str]:
+        """
+        Build an ``{item_id: value}`` index of every item-container in one pass.
+
+        Used on the edit path so that looking up an item's current value is a
+        dict access instead of a fresh full-document parse per request.
+
+        Args:
+            html_content: HTML string containing the table.
+
+        Returns:
+            Mapping of item-container id to its item-data text.
+        """
+        soup = BeautifulSoup(html_content, _DOC_PARSER, parse_only=_TABLE_STRAINER)
+        index: Dict[str, str] = {}
+        for container in soup.find_all('span', class_='item-container'):
+            item_id = container.get('id')
+            if not item_id:
+                continue
+            item_data = container.find('span', class_='item-data')
+            index[item_id] = item_data.get_text(strip=False) if item_data else ''
+        return index
+
     @staticmethod
     def update_item_value(html_content: str, item_id: str, new_value: str) -> str:
         """
@@ -206,7 +366,7 @@ class HTMLParser:
         Returns:
             Updated HTML string
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
         container = soup.find('span', id=item_id)
         
         if not container:
@@ -224,6 +384,67 @@ class HTMLParser:
         
         return str(soup)
 
+    @staticmethod
+    def apply_edits(html_content: str, entries: List[Dict]) -> str:
+        """
+        Replay a sequence of value edits against the HTML in a single pass.
+
+        Each entry is an edit-log record with at least ``item_id`` and ``new``
+        keys (as written to ``edits.jsonl``).  The document is parsed once and
+        all edits are applied to the same DOM, so replay cost is one parse +
+        one serialize regardless of how many edits are pending.
+
+        Entries that blank out an item in a multi-value field remove the
+        item-container entirely (mirroring the auto-remove behaviour of the
+        ``/item`` endpoint).  Entries whose item no longer exists are skipped,
+        which makes replay idempotent over already-applied states.
+
+        Args:
+            html_content: HTML string containing the table.
+            entries:      Edit-log records, in application order.
+
+        Returns:
+            Updated HTML string.
+        """
+        if not entries:
+            return html_content
+
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
+
+        # find(id=...) walks the whole tree per call, which would make replay
+        # O(document × entries); one pass building an id→element index keeps
+        # it at O(document + entries).
+        id_map = {s['id']: s for s in soup.find_all('span', id=True)}
+
+        for entry in entries:
+            item_id = entry.get('item_id')
+            new_value = entry.get('new', '')
+            if not item_id:
+                continue
+
+            container = id_map.get(item_id)
+            if container is None:
+                continue
+
+            # Blank value in a multi-value field → drop the whole container
+            # so no stray separators survive into the exported CSV.
+            parts = item_id.split('-')
+            field_name = '-'.join(parts[1:-1]) if len(parts) >= 3 else ''
+            if field_name in HTMLParser.ITEM_SEPARATORS and new_value.strip() == '':
+                container.decompose()
+                del id_map[item_id]
+                continue
+
+            item_data = container.find('span', class_='item-data')
+            if item_data:
+                item_data.string = new_value
+            else:
+                new_item_data = soup.new_tag('span', **{'class': 'item-data'})
+                new_item_data.string = new_value
+                container.insert(0, new_item_data)
+
+        return str(soup)
+
     @staticmethod
     def delete_row(html_content: str, row_id: str) -> str:
         """
@@ -237,7 +458,7 @@ class HTMLParser:
         Returns:
             Updated HTML string with the row removed.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
         row = soup.find('tr', id=row_id)
         if row:
             row.decompose()
@@ -258,7 +479,7 @@ class HTMLParser:
             Tuple ``(updated_html, new_row_id)`` where ``new_row_id`` is the
             ``id`` of the newly created row (e.g., ``"row5"``).
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
         table = soup.find('table', id='table-data')
         
         if not table:
@@ -350,7 +571,7 @@ class HTMLParser:
             Tuple ``(updated_html, new_item_id)`` where ``new_item_id`` is the
             ``id`` of the single empty item-container left in the cell.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
         row = soup.find('tr', id=row_id)
         if not row:
             return html_content, ''
@@ -398,7 +619,7 @@ class HTMLParser:
         Returns:
             Updated HTML string.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
         container: Tag = soup.find('span', id=item_id)
         if not container:
             return html_content  # nothing to do
@@ -424,7 +645,7 @@ class HTMLParser:
             - ``has_value`` is True if any item-container has non-empty content
             - ``container_count`` is the number of item-containers in the cell
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER, parse_only=_TABLE_STRAINER)
         row = soup.find('tr', id=row_id)
         if not row:
             return False, 0
@@ -474,7 +695,7 @@ class HTMLParser:
             Tuple (updated_html_string, new_item_id).
             new_item_id is the id attribute assigned to the new container.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
         ref_container = soup.find('span', id=after_item_id)
         if not ref_container:
             return html_content, ''
@@ -514,35 +735,45 @@ class HTMLParser:
         return str(soup), new_item_id
 
     @staticmethod
-    def apply_edit_tracking(html_content: str, edited_item_ids: List[str]) -> str:
+    def apply_edit_tracking(html_content: str, edited_item_ids: Iterable[str]) -> str:
         """
         Apply visual tracking (grey background) to edited items.
-        
+
         Args:
             html_content: Original HTML string
-            edited_item_ids: List of item IDs that have been edited
+            edited_item_ids: Item IDs that have been edited
                              (IDs of .item-container spans)
             
         Returns:
             HTML string with edit tracking applied
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        for item_id in edited_item_ids:
-            container = soup.find('span', id=item_id)
-            if container:
-                # item-data is a direct child of the item-container
-                item_data = container.find('span', class_='item-data')
-                if item_data:
-                    existing_classes = item_data.get('class', [])
-                    if isinstance(existing_classes, list):
-                        if 'edited' not in existing_classes:
-                            existing_classes.append('edited')
-                        item_data['class'] = existing_classes
-                    else:
-                        item_data['class'] = f"{existing_classes} edited".strip()
-        
-        return str(soup)
+        edited_set = frozenset(edited_item_ids)
+        cache_key = ('edited', HTMLParser._content_key(html_content), tuple(sorted(edited_set)))
+        cached = HTMLParser._memo_get(cache_key)
+        if cached is not None:
+            return cached
+
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
+
+        # One traversal with set-membership tests instead of one full-document
+        # find() per edited id — O(document + edits) rather than O(document × edits).
+        for container in soup.find_all('span', id=True):
+            if container['id'] not in edited_set:
+                continue
+            # item-data is a direct child of the item-container
+            item_data = container.find('span', class_='item-data')
+            if item_data:
+                existing_classes = item_data.get('class', [])
+                if isinstance(existing_classes, list):
+                    if 'edited' not in existing_classes:
+                        existing_classes.append('edited')
+                    item_data['class'] = existing_classes
+                else:
+                    item_data['class'] = f"{existing_classes} edited".strip()
+
+        result = HTMLParser._serialize_like_input(soup, html_content)
+        HTMLParser._memo_put(cache_key, result)
+        return result
     
     @staticmethod
     def remove_edit_tracking(html_content: str) -> str:
@@ -555,7 +786,7 @@ class HTMLParser:
         Returns:
             HTML string with all edit tracking removed
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
         edited_items = soup.find_all('span', class_='item-data')
         
         for item in edited_items:
@@ -570,8 +801,8 @@ class HTMLParser:
                 if 'edited' in classes_list:
                     classes_list.remove('edited')
                     item['class'] = ' '.join(classes_list) if classes_list else None
-        
-        return str(soup)
+
+        return HTMLParser._serialize_like_input(soup, html_content)
     
     @staticmethod
     def apply_added_tracking(
@@ -592,44 +823,47 @@ class HTMLParser:
         Returns:
             HTML string with added tracking applied
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Apply green background to added items
-        for item_id in added_item_ids:
-            container = soup.find('span', id=item_id)
-            if container:
-                # item-data is a direct child of the item-container
-                item_data = container.find('span', class_='item-data')
-                if item_data:
-                    existing_classes = item_data.get('class', [])
-                    if isinstance(existing_classes, list):
-                        if 'added' not in existing_classes:
-                            existing_classes.append('added')
-                        item_data['class'] = existing_classes
-                    else:
-                        # Handle string class attribute
-                        classes_list = existing_classes.split()
-                        if 'added' not in classes_list:
-                            classes_list.append('added')
-                        item_data['class'] = ' '.join(classes_list)
-        
-        # Apply green background to added rows
-        for row_id in added_row_ids:
-            row = soup.find('tr', id=row_id)
-            if row:
-                existing_classes = row.get('class', [])
-                if isinstance(existing_classes, list):
-                    if 'added' not in existing_classes:
-                        existing_classes.append('added')
-                    row['class'] = existing_classes
-                else:
-                    # Handle string class attribute
-                    classes_list = existing_classes.split()
-                    if 'added' not in classes_list:
-                        classes_list.append('added')
-                    row['class'] = ' '.join(classes_list)
-        
-        return str(soup)
+        cache_key = ('added', HTMLParser._content_key(html_content),
+                     tuple(sorted(added_item_ids)), tuple(sorted(added_row_ids)))
+        cached = HTMLParser._memo_get(cache_key)
+        if cached is not None:
+            return cached
+
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
+        added_items = frozenset(added_item_ids)
+        added_rows = frozenset(added_row_ids)
+
+        # One traversal with set-membership tests instead of one full-document
+        # find() per added id.
+        for element in soup.find_all(['span', 'tr'], id=True):
+            if element.name == 'span':
+                if element['id'] not in added_items:
+                    continue
+                # item-data is a direct child of the item-container;
+                # green background marks the item as added
+                target = element.find('span', class_='item-data')
+                if target is None:
+                    continue
+            else:
+                if element['id'] not in added_rows:
+                    continue
+                # green background marks the whole row as added
+                target = element
+            existing_classes = target.get('class', [])
+            if isinstance(existing_classes, list):
+                if 'added' not in existing_classes:
+                    existing_classes.append('added')
+                target['class'] = existing_classes
+            else:
+                # Handle string class attribute
+                classes_list = existing_classes.split()
+                if 'added' not in classes_list:
+                    classes_list.append('added')
+                target['class'] = ' '.join(classes_list)
+
+        result = HTMLParser._serialize_like_input(soup, html_content)
+        HTMLParser._memo_put(cache_key, result)
+        return result
     
     @staticmethod
     def get_row_item_ids(html_content: str, row_id: str) -> List[str]:
@@ -643,7 +877,7 @@ class HTMLParser:
         Returns:
             List of item-container IDs in the row
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER, parse_only=_TABLE_STRAINER)
         row = soup.find('tr', id=row_id)
         
         if not row:
@@ -667,7 +901,7 @@ class HTMLParser:
         Returns:
             List of item-container IDs in the cell
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER, parse_only=_TABLE_STRAINER)
         row = soup.find('tr', id=row_id)
         
         if not row:
@@ -699,7 +933,7 @@ class HTMLParser:
         Returns:
             List of row IDs
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER, parse_only=_TABLE_STRAINER)
         table = soup.find('table', id='table-data')
         
         if not table:
@@ -730,8 +964,10 @@ class HTMLParser:
                 'deleted_item_values': {'0-id-1': 'some value', '5-author-0': 'another value'}
             }
         """
-        baseline_soup = BeautifulSoup(baseline_html, 'html.parser')
-        current_soup = BeautifulSoup(current_html, 'html.parser')
+        baseline_soup = BeautifulSoup(baseline_html, _DOC_PARSER,
+                                      parse_only=_TABLE_STRAINER)
+        current_soup = BeautifulSoup(current_html, _DOC_PARSER,
+                                     parse_only=_TABLE_STRAINER)
         
         baseline_table = baseline_soup.find('table', id='table-data')
         current_table = current_soup.find('table', id='table-data')
@@ -867,7 +1103,7 @@ class HTMLParser:
         Returns:
             HTML string with ghost overlay elements inserted
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _DOC_PARSER)
         table = soup.find('table', id='table-data')
         
         if not table:
@@ -1,18 +1,147 @@
 """Service for managing session files and persistence."""
+import asyncio
+import mmap
 import os
 import json
+import time
 import uuid
+import weakref
+import zstandard
+
+import msgspec
+from collections import OrderedDict
+from msgspec.structs import replace as struct_replace
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from aiofiles import open as aio_open
 
 from models import Session, EditState, RowChangeState, DeletedItemState
-from config import TEMP_DIR
+from config import TEMP_DIR, SESSION_DIR
+
+# Singleton msgspec encoder/decoders: constructing a Decoder is the expensive
+# part, and decoding goes straight from JSON bytes into C-layout structs with
+# no intermediate dicts.
+_JSON_ENCODER = msgspec.json.Encoder()
+_SESSION_DECODER = msgspec.json.Decoder(Session)
+_EDIT_STATE_DECODER = msgspec.json.Decoder(Dict[str, EditState])
+
+
+# ---------------------------------------------------------------------------
+# In-process session cache
+#
+# Every route handler calls ``load_session`` at least once, so without a cache
+# each request re-reads and re-parses ``session.json`` from disk.  Hot sessions
+# are instead served from this LRU/TTL cache; ``save_session`` refreshes the
+# entry after each write and ``delete_session`` / ``invalidate`` evict it.
+# Defensive copies are returned so caller-side mutations cannot corrupt the
+# cached entry.
+# ---------------------------------------------------------------------------
+
+_SESSION_CACHE: "OrderedDict[str, Tuple[Session, float]]" = OrderedDict()
+_SESSION_CACHE_MAX = 512
+_SESSION_CACHE_TTL = 60.0  # seconds
+
+# Debounced session saves: bursts of edits coalesce into one session.json
+# write per session per debounce window instead of one write per keystroke.
+_PENDING_SAVES: "Dict[str, asyncio.TimerHandle]" = {}
+_PENDING_SESSIONS: Dict[str, Session] = {}
+_SAVE_DEBOUNCE_DELAY = 0.5  # seconds
+
+# Debounced edit-state saves, same scheme as session saves: the cache is
+# refreshed immediately (readers go through it), the edit_state.json rewrite
+# is deferred and re-armed per burst.  Durability is covered by the fsynced
+# edit journal, which records every old/new value pair.
+_PENDING_STATE_SAVES: "Dict[str, asyncio.TimerHandle]" = {}
+_PENDING_STATES: Dict[str, Dict[str, EditState]] = {}
+
+# Long-lived append handles for the per-session JSONL logs.  Reopening
+# edits.jsonl for every keystroke cost an open+close syscall pair per edit;
+# with a cached handle the hot path is one buffered write (+fsync).  Any code
+# that unlinks or rewrites a log must call _close_log_fd first so stale
+# handles never write to an unlinked inode.
+_LOG_FDS: "Dict[Path, object]" = {}
+
+# Parsed edit-state cache: {session_id: {item_id: EditState}}.  Refreshed by
+# save_edit_state (the only writer), so per-edit load_edit_state calls skip
+# the disk read and JSON decode entirely once warm.  LRU-bounded like the
+# session cache so long-lived processes don't hold state for every session
+# they have ever touched.
+_EDIT_STATE_CACHE: "OrderedDict[str, Dict[str, EditState]]" = OrderedDict()
+_EDIT_STATE_CACHE_MAX = 512
+
+# Derived {session_id: frozenset(edited item ids)}, maintained alongside the
+# edit-state cache so hot read paths get the edited-id set in O(1) instead of
+# re-filtering the whole state dict per request.
+_EDITED_IDS_CACHE: Dict[str, frozenset] = {}
+
+# Per-session locks serializing the read-modify-write sections of the
+# mutating route handlers — two concurrent edits to the same session would
+# otherwise interleave their load→modify→save steps and lose one edit.
+# Weak values so locks for idle sessions are garbage-collected; a handler
+# inside ``async with`` holds a strong reference, keeping the lock alive for
+# any concurrent acquirer.  Read-only endpoints stay lock-free.
+_SESSION_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Codec for SessionManager-private HTML copies (baseline snapshots and the
+# undo stack).  Table HTML compresses ~10x with zstd, and these files are
+# only ever read back through SessionManager, so compressing them cuts most
+# of a session directory's disk footprint.  The canonical table files stay
+# plain HTML: oc_validator's tools read and write them by path, and the
+# mmap fast path streams their raw bytes to the browser.
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
 
 
 class SessionManager:
     """Manage session storage and persistence."""
-    
+
+    @staticmethod
+    def _cache_put(session: Session) -> None:
+        """Insert or refresh a defensive copy of ``session`` in the cache."""
+        _SESSION_CACHE[session.session_id] = (struct_replace(session), time.monotonic())
+        _SESSION_CACHE.move_to_end(session.session_id)
+        while len(_SESSION_CACHE) > _SESSION_CACHE_MAX:
+            _SESSION_CACHE.popitem(last=False)
+
+    @staticmethod
+    def _cache_get(session_id: str) -> Optional[Session]:
+        """Return a defensive copy of a cached session, or None on miss/expiry."""
+        entry = _SESSION_CACHE.get(session_id)
+        if entry is None:
+            return None
+        session, ts = entry
+        if time.monotonic() - ts > _SESSION_CACHE_TTL:
+            _SESSION_CACHE.pop(session_id, None)
+            return None
+        _SESSION_CACHE.move_to_end(session_id)
+        return struct_replace(session)
+
+    @staticmethod
+    def _edit_state_cache_put(session_id: str, states: Dict[str, EditState]) -> None:
+        """Insert or refresh an edit-state cache entry, evicting LRU overflow."""
+        _EDIT_STATE_CACHE[session_id] = dict(states)
+        _EDITED_IDS_CACHE[session_id] = frozenset(
+            item_id for item_id, state in states.items() if state.edited
+        )
+        _EDIT_STATE_CACHE.move_to_end(session_id)
+        while len(_EDIT_STATE_CACHE) > _EDIT_STATE_CACHE_MAX:
+            evicted, _ = _EDIT_STATE_CACHE.popitem(last=False)
+            _EDITED_IDS_CACHE.pop(evicted, None)
+
+    @staticmethod
+    def session_lock(session_id: str) -> asyncio.Lock:
+        """Return the per-session mutation lock, creating it on first use."""
+        lock = _SESSION_LOCKS.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            _SESSION_LOCKS[session_id] = lock
+        return lock
+
+    @staticmethod
+    def invalidate(session_id: str) -> None:
+        """Evict a session from the in-process cache (e.g. after out-of-band edits)."""
+        _SESSION_CACHE.pop(session_id, None)
+
     @staticmethod
     def create_session_id() -> str:
         """Generate a unique session ID."""
@@ -33,27 +162,6 @@ class SessionManager:
         session_dir.mkdir(parents=True, exist_ok=True)
         return session_dir
     
-    @staticmethod
-    async def save_uploaded_file(session_id: str, file_content: bytes, filename: str) -> str:
-        """
-        Save an uploaded CSV file to session directory.
-        
-        Args:
-            session_id: Session identifier
-            file_content: File content as bytes
-            filename: Original filename
-            
-        Returns:
-            Path to saved file
-        """
-        session_dir = TEMP_DIR / session_id
-        file_path = session_dir / filename
-        
-        async with aio_open(file_path, 'wb') as f:
-            await f.write(file_content)
-        
-        return str(file_path)
-    
     @staticmethod
     async def save_session(session: Session) -> None:
         """
@@ -62,12 +170,128 @@ class SessionManager:
         Args:
             session: Session object to save
         """
+        # A direct save supersedes any debounced save still pending
+        handle = _PENDING_SAVES.pop(session.session_id, None)
+        if handle is not None:
+            handle.cancel()
+        _PENDING_SESSIONS.pop(session.session_id, None)
+
         session_dir = TEMP_DIR / session.session_id
         session_file = session_dir / 'session.json'
-        
-        async with aio_open(session_file, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(session.to_dict(), indent=2))
-    
+
+        async with aio_open(session_file, 'wb') as f:
+            await f.write(_JSON_ENCODER.encode(session))
+
+        SessionManager._cache_put(session)
+        SessionManager._index_upsert(session)
+
+    @staticmethod
+    def schedule_save(session: Session, delay: float = _SAVE_DEBOUNCE_DELAY) -> None:
+        """
+        Persist a session lazily, coalescing bursts of edits into one write.
+
+        The in-process cache is refreshed immediately so readers observe the
+        new state; the disk write is deferred by ``delay`` seconds and
+        re-armed on every call, so N edits in a burst cost one session.json
+        rewrite instead of N.  ``save_session`` and ``flush_pending`` cancel
+        or flush the timer respectively.
+
+        Args:
+            session: Session object to save.
+            delay:   Debounce window in seconds.
+        """
+        session_id = session.session_id
+        SessionManager._cache_put(session)
+
+        handle = _PENDING_SAVES.pop(session_id, None)
+        if handle is not None:
+            handle.cancel()
+
+        _PENDING_SESSIONS[session_id] = session
+        loop = asyncio.get_running_loop()
+        _PENDING_SAVES[session_id] = loop.call_later(
+            delay,
+            lambda: asyncio.ensure_future(SessionManager._do_scheduled_save(session_id))
+        )
+
+    @staticmethod
+    async def _do_scheduled_save(session_id: str) -> None:
+        """Timer callback target: perform the deferred session write."""
+        _PENDING_SAVES.pop(session_id, None)
+        session = _PENDING_SESSIONS.pop(session_id, None)
+        if session is not None:
+            await SessionManager.save_session(session)
+
+    @staticmethod
+    def schedule_edit_state_save(
+        session_id: str, edit_states: Dict[str, EditState],
+        delay: float = _SAVE_DEBOUNCE_DELAY
+    ) -> None:
+        """
+        Persist edit state lazily, coalescing bursts of edits into one write.
+
+        The parsed-state cache is refreshed immediately so readers observe
+        the new state; the edit_state.json rewrite is deferred by ``delay``
+        seconds and re-armed on every call.  Safe because the fsynced edit
+        journal already records each change durably.
+
+        Args:
+            session_id:  Session identifier.
+            edit_states: Dictionary of item_id -> EditState.
+            delay:       Debounce window in seconds.
+        """
+        SessionManager._edit_state_cache_put(session_id, edit_states)
+
+        handle = _PENDING_STATE_SAVES.pop(session_id, None)
+        if handle is not None:
+            handle.cancel()
+
+        _PENDING_STATES[session_id] = dict(edit_states)
+        loop = asyncio.get_running_loop()
+        _PENDING_STATE_SAVES[session_id] = loop.call_later(
+            delay,
+            lambda: asyncio.ensure_future(
+                SessionManager._do_scheduled_state_save(session_id)
+            )
+        )
+
+    @staticmethod
+    async def _do_scheduled_state_save(session_id: str) -> None:
+        """Timer callback target: perform the deferred edit-state write."""
+        _PENDING_STATE_SAVES.pop(session_id, None)
+        states = _PENDING_STATES.pop(session_id, None)
+        if states is not None:
+            await SessionManager.save_edit_state(session_id, states)
+
+    @staticmethod
+    async def flush_pending(session_id: Optional[str] = None) -> None:
+        """
+        Write out debounced session and edit-state saves immediately.
+
+        Args:
+            session_id: Flush only this session, or all pending if None.
+        """
+        if session_id is not None:
+            ids = [session_id] if session_id in _PENDING_SESSIONS else []
+            state_ids = [session_id] if session_id in _PENDING_STATES else []
+        else:
+            ids = list(_PENDING_SESSIONS.keys())
+            state_ids = list(_PENDING_STATES.keys())
+        for sid in ids:
+            handle = _PENDING_SAVES.pop(sid, None)
+            if handle is not None:
+                handle.cancel()
+            session = _PENDING_SESSIONS.pop(sid, None)
+            if session is not None:
+                await SessionManager.save_session(session)
+        for sid in state_ids:
+            handle = _PENDING_STATE_SAVES.pop(sid, None)
+            if handle is not None:
+                handle.cancel()
+            states = _PENDING_STATES.pop(sid, None)
+            if states is not None:
+                await SessionManager.save_edit_state(sid, states)
+
     @staticmethod
     async def load_session(session_id: str) -> Optional[Session]:
         """
@@ -79,15 +303,21 @@ class SessionManager:
         Returns:
             Session object or None if not found
         """
+        cached = SessionManager._cache_get(session_id)
+        if cached is not None:
+            return cached
+
         session_file = TEMP_DIR / session_id / 'session.json'
-        
+
         if not session_file.exists():
             return None
-        
-        async with aio_open(session_file, 'r', encoding='utf-8') as f:
+
+        async with aio_open(session_file, 'rb') as f:
             content = await f.read()
-        
-        return Session.from_dict(json.loads(content))
+
+        session = _SESSION_DECODER.decode(content)
+        SessionManager._cache_put(session)
+        return session
     
     @staticmethod
     async def save_edit_state(session_id: str, edit_states: Dict[str, EditState]) -> None:
@@ -100,16 +330,19 @@ class SessionManager:
         """
         session_dir = TEMP_DIR / session_id
         state_file = session_dir / 'edit_state.json'
-        
-        # Convert EditState objects to dicts
-        state_dict = {
-            item_id: state.to_dict() 
-            for item_id, state in edit_states.items()
-        }
-        
-        async with aio_open(state_file, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(state_dict, indent=2))
-    
+
+        # An immediate write supersedes any pending debounced one
+        handle = _PENDING_STATE_SAVES.pop(session_id, None)
+        if handle is not None:
+            handle.cancel()
+        _PENDING_STATES.pop(session_id, None)
+
+        # msgspec encodes the dict of structs natively — no to_dict pass
+        async with aio_open(state_file, 'wb') as f:
+            await f.write(_JSON_ENCODER.encode(edit_states))
+
+        SessionManager._edit_state_cache_put(session_id, edit_states)
+
     @staticmethod
     async def load_edit_state(session_id: str) -> Dict[str, EditState]:
         """
@@ -121,21 +354,49 @@ class SessionManager:
         Returns:
             Dictionary of item_id -> EditState
         """
+        cached = _EDIT_STATE_CACHE.get(session_id)
+        if cached is not None:
+            _EDIT_STATE_CACHE.move_to_end(session_id)
+            return dict(cached)
+
+        # A debounced save may still be pending after a cache eviction; the
+        # on-disk file would be stale in that window.
+        pending = _PENDING_STATES.get(session_id)
+        if pending is not None:
+            return dict(pending)
+
         state_file = TEMP_DIR / session_id / 'edit_state.json'
-        
+
         if not state_file.exists():
             return {}
-        
-        async with aio_open(state_file, 'r', encoding='utf-8') as f:
+
+        async with aio_open(state_file, 'rb') as f:
             content = await f.read()
-        
-        state_dict = json.loads(content)
-        
-        # Convert dicts back to EditState objects
-        return {
-            item_id: EditState.from_dict(state_data)
-            for item_id, state_data in state_dict.items()
-        }
+
+        states = _EDIT_STATE_DECODER.decode(content)
+        SessionManager._edit_state_cache_put(session_id, states)
+        return states
+
+    @staticmethod
+    async def get_edited_ids(session_id: str) -> frozenset:
+        """
+        Return the set of item ids currently marked as edited.
+
+        The set is derived once per edit-state write and cached, so read
+        paths (``get_html``, filtered rows) avoid re-filtering the whole
+        state dict on every request.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Frozen set of edited item ids (possibly empty).
+        """
+        cached = _EDITED_IDS_CACHE.get(session_id)
+        if cached is not None:
+            return cached
+        await SessionManager.load_edit_state(session_id)
+        return _EDITED_IDS_CACHE.get(session_id, frozenset())
     
     # ---------------------------------------------------------------------------
     # HTML file-name scheme
@@ -213,7 +474,74 @@ class SessionManager:
                 return content
         except Exception:
             return None
-    
+
+    @staticmethod
+    def open_html_mmap(session_id: str, table_type: str) -> Optional[mmap.mmap]:
+        """
+        Memory-map an HTML file read-only for zero-copy serving.
+
+        The kernel pages the file in on demand, so a multi-MB table never has
+        to exist as a Python ``str`` just to be sent over the wire.  The
+        backing fd is closed immediately (the mapping keeps it alive); the
+        caller is responsible for closing the returned mmap.
+
+        Args:
+            session_id: Session identifier.
+            table_type: 'meta', 'cits', or 'display'.
+
+        Returns:
+            A read-only ``mmap.mmap``, or None if the file is missing or empty.
+        """
+        html_file = TEMP_DIR / session_id / SessionManager._html_filename(table_type)
+        try:
+            fd = os.open(html_file, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            if os.fstat(fd).st_size == 0:
+                return None
+            return mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        except (OSError, ValueError):
+            return None
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def has_pending_edits(session_id: str) -> bool:
+        """Return True if the session has edit-log records not yet folded into the HTML."""
+        return SessionManager._edit_log_path(session_id).exists()
+
+    @staticmethod
+    def content_stamp(session_id: str, table_type: str) -> tuple:
+        """
+        Composite (mtime_ns, size) stamp over every file that can change the
+        rendered table HTML: the base HTML, the pending edit log, and the two
+        tracking-state files.  Used to build weak ETags for conditional GETs.
+        """
+        session_dir = TEMP_DIR / session_id
+        files = (
+            session_dir / SessionManager._html_filename(table_type),
+            SessionManager._edit_log_path(session_id),
+            session_dir / 'edit_state.json',
+            session_dir / 'row_change_state.json',
+        )
+        return tuple(SessionManager._file_stamp(p) for p in files)
+
+    @staticmethod
+    def session_stamp(session_id: str) -> tuple:
+        """
+        Composite (mtime_ns, size) stamp over the files backing the session
+        info response: session.json, the edit-state file and the pending edit
+        log.  Used to build weak ETags for conditional GETs.
+        """
+        session_dir = TEMP_DIR / session_id
+        files = (
+            session_dir / 'session.json',
+            session_dir / 'edit_state.json',
+            SessionManager._edit_log_path(session_id),
+        )
+        return tuple(SessionManager._file_stamp(p) for p in files)
+
     @staticmethod
     async def load_report(session_id: str, table_type: str) -> Optional[dict]:
         """
@@ -237,8 +565,306 @@ class SessionManager:
         async with aio_open(report_path, 'r', encoding='utf-8') as f:
             content = await f.read()
         
-        return json.loads(content)
+        return msgspec.json.decode(content)
     
+    # ---------------------------------------------------------------------------
+    # Append-only edit log
+    #
+    # Plain value edits no longer rewrite the whole HTML file: each edit is one
+    # JSONL record ({ts, item_id, old, new}) appended to ``edits.jsonl``, so
+    # write amplification per edit is O(record), not O(html).  Read paths call
+    # ``materialize_html`` which replays the pending log over the base HTML in
+    # memory (cached by file mtime/size).  Structural mutations and
+    # re-validation call ``compact_edit_log`` first, which folds the log into
+    # the base HTML and truncates it.  ``edits_redo.jsonl`` holds undone log
+    # entries so they can be re-applied; any new mutation clears it.
+    # ---------------------------------------------------------------------------
+
+    # Fold the log into the base HTML once it grows past this size: replaying
+    # a huge log on every read eventually costs more than one base rewrite.
+    _EDIT_LOG_COMPACT_BYTES = 1024 * 1024
+
+    @staticmethod
+    def _edit_log_path(session_id: str) -> Path:
+        """Return path to the append-only edit log for a session."""
+        return TEMP_DIR / session_id / 'edits.jsonl'
+
+    @staticmethod
+    def _redo_log_path(session_id: str) -> Path:
+        """Return path to the redo log (undone edit-log entries)."""
+        return TEMP_DIR / session_id / 'edits_redo.jsonl'
+
+    @staticmethod
+    def _log_fd(path: Path):
+        """Return the cached append handle for a log file, opening on first use."""
+        f = _LOG_FDS.get(path)
+        if f is None or f.closed:
+            f = open(path, 'ab')
+            _LOG_FDS[path] = f
+        return f
+
+    @staticmethod
+    def _close_log_fd(path: Path) -> None:
+        """Close and drop the cached append handle for ``path`` (no-op if absent)."""
+        f = _LOG_FDS.pop(path, None)
+        if f is not None and not f.closed:
+            f.close()
+
+    @staticmethod
+    def close_log_fds() -> None:
+        """Close every cached log handle (application shutdown)."""
+        for path in list(_LOG_FDS):
+            SessionManager._close_log_fd(path)
+
+    @staticmethod
+    async def _append_jsonl(path: Path, entries: list) -> None:
+        """Append records to a JSONL file in one write, flushed to disk."""
+        payload = b''.join(_JSON_ENCODER.encode(entry) + b'\n' for entry in entries)
+
+        def _write() -> None:
+            f = SessionManager._log_fd(path)
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        await asyncio.to_thread(_write)
+
+    @staticmethod
+    async def _read_jsonl(path: Path) -> list:
+        """Read all records from a JSONL file.  Returns ``[]`` on miss."""
+        if not path.exists():
+            return []
+        try:
+            async with aio_open(path, 'r', encoding='utf-8') as f:
+                content = await f.read()
+        except Exception:
+            return []
+        entries = []
+        for line in content.splitlines():
+            line = line.strip()
+            if line:
+                entries.append(msgspec.json.decode(line))
+        return entries
+
+    @staticmethod
+    async def _rewrite_jsonl(path: Path, entries: list) -> None:
+        """Replace a JSONL file's contents (used when popping entries)."""
+        SessionManager._close_log_fd(path)
+        if not entries:
+            path.unlink(missing_ok=True)
+            return
+        payload = b''.join(_JSON_ENCODER.encode(entry) + b'\n' for entry in entries)
+        async with aio_open(path, 'wb') as f:
+            await f.write(payload)
+
+    @staticmethod
+    async def append_edit_entries(session_id: str, entries: list,
+                                  table_type: Optional[str] = None) -> None:
+        """
+        Append edit records to the session's edit log in a single write.
+
+        A new edit invalidates forward history, so the redo log is cleared.
+        When ``table_type`` is given and the log has grown past
+        ``_EDIT_LOG_COMPACT_BYTES``, the log is folded into the base HTML so
+        read paths never replay an unbounded backlog.
+
+        Args:
+            session_id: Session identifier.
+            entries:    List of edit-log records ({ts, item_id, old, new}).
+            table_type: Table the edits target; enables threshold compaction.
+        """
+        redo_log = SessionManager._redo_log_path(session_id)
+        SessionManager._close_log_fd(redo_log)
+        redo_log.unlink(missing_ok=True)
+        log_path = SessionManager._edit_log_path(session_id)
+        await SessionManager._append_jsonl(log_path, entries)
+        if table_type is not None:
+            stamp = SessionManager._file_stamp(log_path)
+            if stamp is not None and stamp[1] > SessionManager._EDIT_LOG_COMPACT_BYTES:
+                await SessionManager.compact_edit_log(session_id, table_type)
+
+    @staticmethod
+    async def load_edit_log(session_id: str) -> list:
+        """Load all pending edit-log records for a session."""
+        return await SessionManager._read_jsonl(SessionManager._edit_log_path(session_id))
+
+    @staticmethod
+    async def pop_edit_log_entry(session_id: str) -> Optional[dict]:
+        """
+        Undo helper: remove the most recent edit-log record and move it onto
+        the redo log.  Returns the popped record or None if the log is empty.
+        """
+        entries = await SessionManager.load_edit_log(session_id)
+        if not entries:
+            return None
+        last = entries.pop()
+        await SessionManager._rewrite_jsonl(
+            SessionManager._edit_log_path(session_id), entries
+        )
+        await SessionManager._append_jsonl(
+            SessionManager._redo_log_path(session_id), [last]
+        )
+        return last
+
+    @staticmethod
+    async def pop_redo_log_entry(session_id: str) -> Optional[dict]:
+        """
+        Redo helper: move the most recently undone record back onto the edit
+        log.  Returns the re-applied record or None if there is nothing to redo.
+        """
+        entries = await SessionManager._read_jsonl(SessionManager._redo_log_path(session_id))
+        if not entries:
+            return None
+        last = entries.pop()
+        await SessionManager._rewrite_jsonl(
+            SessionManager._redo_log_path(session_id), entries
+        )
+        await SessionManager._append_jsonl(
+            SessionManager._edit_log_path(session_id), [last]
+        )
+        return last
+
+    @staticmethod
+    def _file_stamp(path: Path) -> tuple:
+        """Return an (mtime_ns, size) stamp for cache keying, or None if absent."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    # (session_id, table_type) -> (html_stamp, log_stamp, materialized_html).
+    # Each value holds a whole materialized document, so the LRU bound is
+    # kept small; an eviction only costs a re-materialization on the next
+    # read of that session.
+    _materialize_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _MATERIALIZE_CACHE_MAX = 32
+
+    @staticmethod
+    async def materialize_html(session_id: str, table_type: str) -> Optional[str]:
+        """
+        Return the current HTML for a table with all pending edit-log records
+        applied.
+
+        The base HTML on disk is only rewritten on compaction; this method
+        replays the pending log in memory and caches the result keyed by the
+        mtime/size of both files, so repeated reads of a hot session cost a
+        dict lookup.
+
+        Args:
+            session_id: Session identifier.
+            table_type: 'meta', 'cits', or 'display'.
+
+        Returns:
+            Materialized HTML string or None if the base HTML is not found.
+        """
+        from services.html_parser import HTMLParser
+
+        html_file = TEMP_DIR / session_id / SessionManager._html_filename(table_type)
+        log_file = SessionManager._edit_log_path(session_id)
+
+        html_stamp = SessionManager._file_stamp(html_file)
+        log_stamp = SessionManager._file_stamp(log_file)
+
+        cache_key = (session_id, table_type)
+        cached = SessionManager._materialize_cache.get(cache_key)
+        if cached is not None and cached[0] == html_stamp and cached[1] == log_stamp:
+            SessionManager._materialize_cache.move_to_end(cache_key)
+            return cached[2]
+
+        html_content = await SessionManager.load_html(session_id, table_type)
+        if html_content is None:
+            return None
+
+        entries = await SessionManager.load_edit_log(session_id)
+        if entries:
+            html_content = HTMLParser.apply_edits(html_content, entries)
+
+        SessionManager._materialize_cache[cache_key] = (html_stamp, log_stamp, html_content)
+        SessionManager._materialize_cache.move_to_end(cache_key)
+        while len(SessionManager._materialize_cache) > SessionManager._MATERIALIZE_CACHE_MAX:
+            SessionManager._materialize_cache.popitem(last=False)
+        return html_content
+
+    # (session_id, table_type) -> (html_stamp, log_stamp, {item_id: value}).
+    # LRU-bounded like the edit-state cache; a miss re-derives the index from
+    # the (cached) materialized HTML in one pass.
+    _item_index_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _ITEM_INDEX_CACHE_MAX = 512
+
+    @staticmethod
+    async def get_item_index(session_id: str, table_type: str) -> Optional[Dict[str, str]]:
+        """
+        Return an ``{item_id: value}`` index of the materialized HTML.
+
+        The index is built with a single parse and cached with the same
+        mtime/size stamps as the materialize cache, so per-edit value lookups
+        cost a dict access instead of a full-document parse.
+
+        Args:
+            session_id: Session identifier.
+            table_type: 'meta', 'cits', or 'display'.
+
+        Returns:
+            The index, or None if the base HTML is not found.
+        """
+        from services.html_parser import HTMLParser
+
+        html_file = TEMP_DIR / session_id / SessionManager._html_filename(table_type)
+        log_file = SessionManager._edit_log_path(session_id)
+
+        html_stamp = SessionManager._file_stamp(html_file)
+        log_stamp = SessionManager._file_stamp(log_file)
+
+        cache_key = (session_id, table_type)
+        cached = SessionManager._item_index_cache.get(cache_key)
+        if cached is not None and cached[0] == html_stamp and cached[1] == log_stamp:
+            SessionManager._item_index_cache.move_to_end(cache_key)
+            return cached[2]
+
+        html_content = await SessionManager.materialize_html(session_id, table_type)
+        if html_content is None:
+            return None
+
+        index = HTMLParser.build_item_value_index(html_content)
+        SessionManager._item_index_cache[cache_key] = (html_stamp, log_stamp, index)
+        SessionManager._item_index_cache.move_to_end(cache_key)
+        while len(SessionManager._item_index_cache) > SessionManager._ITEM_INDEX_CACHE_MAX:
+            SessionManager._item_index_cache.popitem(last=False)
+        return index
+
+    @staticmethod
+    async def compact_edit_log(session_id: str, table_type: str) -> Optional[str]:
+        """
+        Fold the pending edit log into the base HTML file and truncate the log.
+
+        Called before structural mutations (row/item add/delete, clear-cell)
+        and before re-validation, so those paths always see a consistent
+        on-disk HTML with no pending log records.
+
+        Args:
+            session_id: Session identifier.
+            table_type: 'meta' or 'cits' (the individual, parseable table).
+
+        Returns:
+            The current HTML after compaction, or None if no HTML exists.
+        """
+        entries = await SessionManager.load_edit_log(session_id)
+        if not entries:
+            return await SessionManager.load_html(session_id, table_type)
+
+        html_content = await SessionManager.materialize_html(session_id, table_type)
+        if html_content is None:
+            return None
+
+        await SessionManager.save_html(session_id, html_content, table_type)
+        log_path = SessionManager._edit_log_path(session_id)
+        SessionManager._close_log_fd(log_path)
+        log_path.unlink(missing_ok=True)
+        SessionManager._materialize_cache.pop((session_id, table_type), None)
+        SessionManager._item_index_cache.pop((session_id, table_type), None)
+        return html_content
+
     # ---------------------------------------------------------------------------
     # Baseline snapshot management (for deletion detection)
     # ---------------------------------------------------------------------------
@@ -246,7 +872,28 @@ class SessionManager:
     @staticmethod
     def _baseline_filename(table_type: str) -> str:
         """Return the on-disk filename for baseline snapshots."""
-        return f"baseline_{table_type}.html"
+        return f"baseline_{table_type}.html.zst"
+
+    @staticmethod
+    async def _write_compressed_html(path: Path, html_content: str) -> None:
+        """Write an HTML string to ``path`` zstd-compressed."""
+        data = _ZSTD_COMPRESSOR.compress(html_content.encode('utf-8'))
+        async with aio_open(path, 'wb') as f:
+            await f.write(data)
+
+    @staticmethod
+    async def _read_compressed_html(path: Path) -> Optional[str]:
+        """Read a zstd-compressed HTML file.  Returns None on miss/corruption."""
+        if not path.exists():
+            return None
+        try:
+            async with aio_open(path, 'rb') as f:
+                data = await f.read()
+            if not data:
+                return None
+            return _ZSTD_DECOMPRESSOR.decompress(data).decode('utf-8')
+        except Exception:
+            return None
     
     @staticmethod
     async def save_baseline_snapshot(session_id: str, html_content: str, table_type: str) -> None:
@@ -263,9 +910,8 @@ class SessionManager:
         """
         session_dir = TEMP_DIR / session_id
         baseline_file = session_dir / SessionManager._baseline_filename(table_type)
-        
-        async with aio_open(baseline_file, 'w', encoding='utf-8') as f:
-            await f.write(html_content)
+
+        await SessionManager._write_compressed_html(baseline_file, html_content)
     
     @staticmethod
     async def load_baseline_snapshot(session_id: str, table_type: str) -> Optional[str]:
@@ -280,19 +926,7 @@ class SessionManager:
             Baseline HTML content as string or None if not found
         """
         baseline_file = TEMP_DIR / session_id / SessionManager._baseline_filename(table_type)
-        
-        if not baseline_file.exists():
-            return None
-        
-        if baseline_file.stat().st_size == 0:
-            return None
-        
-        try:
-            async with aio_open(baseline_file, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                return content
-        except Exception:
-            return None
+        return await SessionManager._read_compressed_html(baseline_file)
     
     # ---------------------------------------------------------------------------
     # Row change state management (added/deleted row tracking)
@@ -425,6 +1059,11 @@ class SessionManager:
         """Return path to the undo-snapshots subdirectory for a session."""
         return TEMP_DIR / session_id / 'undo'
 
+    @staticmethod
+    def _undo_html_path(undo_dir: Path, table_type: str, idx: int) -> Path:
+        """Return path to the zstd-compressed HTML snapshot ``idx``."""
+        return undo_dir / f"{table_type}_{idx}.html.zst"
+
     @staticmethod
     async def load_undo_state(session_id: str) -> dict:
         """Load undo/redo index from ``undo_state.json``.  Returns ``{}`` on miss."""
@@ -459,12 +1098,17 @@ class SessionManager:
         undo_dir = SessionManager._undo_dir(session_id)
         undo_dir.mkdir(parents=True, exist_ok=True)
 
+        # A new mutation invalidates forward history in the edit log too
+        redo_log = SessionManager._redo_log_path(session_id)
+        SessionManager._close_log_fd(redo_log)
+        redo_log.unlink(missing_ok=True)
+
         state = await SessionManager.load_undo_state(session_id)
         ts = state.get(table_type, {'undo': [], 'redo': []})
 
         # Clear redo snapshots
         for idx in ts.get('redo', []):
-            (undo_dir / f"{table_type}_{idx}.html").unlink(missing_ok=True)
+            SessionManager._undo_html_path(undo_dir, table_type, idx).unlink(missing_ok=True)
             (undo_dir / f"{table_type}_{idx}_edit_state.json").unlink(missing_ok=True)
             (undo_dir / f"{table_type}_{idx}_row_change_state.json").unlink(missing_ok=True)
         ts['redo'] = []
@@ -474,10 +1118,9 @@ class SessionManager:
         # Choose a monotonically increasing index
         new_idx = (max(undo_stack) + 1) if undo_stack else 0
         
-        # Save HTML snapshot
-        snapshot_path = undo_dir / f"{table_type}_{new_idx}.html"
-        async with aio_open(snapshot_path, 'w', encoding='utf-8') as f:
-            await f.write(html_content)
+        # Save HTML snapshot (compressed — only SessionManager reads it back)
+        snapshot_path = SessionManager._undo_html_path(undo_dir, table_type, new_idx)
+        await SessionManager._write_compressed_html(snapshot_path, html_content)
         
         # Save edit_state snapshot
         edit_states = await SessionManager.load_edit_state(session_id)
@@ -504,7 +1147,7 @@ class SessionManager:
         # Enforce maximum depth — remove oldest entries
         while len(undo_stack) > SessionManager.MAX_UNDO_DEPTH:
             oldest = undo_stack.pop(0)
-            (undo_dir / f"{table_type}_{oldest}.html").unlink(missing_ok=True)
+            SessionManager._undo_html_path(undo_dir, table_type, oldest).unlink(missing_ok=True)
             (undo_dir / f"{table_type}_{oldest}_edit_state.json").unlink(missing_ok=True)
             (undo_dir / f"{table_type}_{oldest}_row_change_state.json").unlink(missing_ok=True)
 
@@ -537,16 +1180,14 @@ class SessionManager:
 
         # Pop most-recent undo snapshot
         prev_idx = undo_stack.pop()
-        snapshot_path = undo_dir / f"{table_type}_{prev_idx}.html"
-        if not snapshot_path.exists():
+        snapshot_path = SessionManager._undo_html_path(undo_dir, table_type, prev_idx)
+        prev_html = await SessionManager._read_compressed_html(snapshot_path)
+        if prev_html is None:
             ts['undo'] = undo_stack
             state[table_type] = ts
             await SessionManager.save_undo_state(session_id, state)
             return None, state
 
-        async with aio_open(snapshot_path, 'r', encoding='utf-8') as f:
-            prev_html = await f.read()
-
         # Restore edit_state from snapshot
         edit_state_path = undo_dir / f"{table_type}_{prev_idx}_edit_state.json"
         if edit_state_path.exists():
@@ -573,13 +1214,21 @@ class SessionManager:
             }
             await SessionManager.save_row_change_state(session_id, row_change_states)
 
+        # Delete the popped snapshot files: indices are reused once the stacks
+        # shrink, so a leftover file at this index could later be read back as
+        # if it were a fresh snapshot.
+        snapshot_path.unlink(missing_ok=True)
+        edit_state_path.unlink(missing_ok=True)
+        row_change_state_path.unlink(missing_ok=True)
+
         # Save current HTML onto redo stack
         redo_stack: list = ts.get('redo', [])
         all_existing = undo_stack + redo_stack
         redo_idx = (max(all_existing) + 1) if all_existing else 0
-        async with aio_open(undo_dir / f"{table_type}_{redo_idx}.html",
-                            'w', encoding='utf-8') as f:
-            await f.write(current_html)
+        await SessionManager._write_compressed_html(
+            SessionManager._undo_html_path(undo_dir, table_type, redo_idx),
+            current_html
+        )
         redo_stack.append(redo_idx)
 
         ts['undo'] = undo_stack
@@ -613,16 +1262,14 @@ class SessionManager:
 
         # Pop most-recent redo snapshot
         next_idx = redo_stack.pop()
-        snapshot_path = undo_dir / f"{table_type}_{next_idx}.html"
-        if not snapshot_path.exists():
+        snapshot_path = SessionManager._undo_html_path(undo_dir, table_type, next_idx)
+        next_html = await SessionManager._read_compressed_html(snapshot_path)
+        if next_html is None:
             ts['redo'] = redo_stack
             state[table_type] = ts
             await SessionManager.save_undo_state(session_id, state)
             return None, state
 
-        async with aio_open(snapshot_path, 'r', encoding='utf-8') as f:
-            next_html = await f.read()
-
         # Restore edit_state from snapshot
         edit_state_path = undo_dir / f"{table_type}_{next_idx}_edit_state.json"
         if edit_state_path.exists():
@@ -649,13 +1296,21 @@ class SessionManager:
             }
             await SessionManager.save_row_change_state(session_id, row_change_states)
 
-        # Push current HTML back onto undo stack
+        # Delete the popped snapshot files — same index-reuse hazard as in
+        # pop_undo_snapshot.
+        snapshot_path.unlink(missing_ok=True)
+        edit_state_path.unlink(missing_ok=True)
+        row_change_state_path.unlink(missing_ok=True)
+
+        # Push current HTML back onto undo stack (compressed, like every
+        # other snapshot — pop_undo_snapshot only reads the .zst path)
         undo_stack: list = ts.get('undo', [])
         all_existing = undo_stack + redo_stack
         undo_idx = (max(all_existing) + 1) if all_existing else 0
-        async with aio_open(undo_dir / f"{table_type}_{undo_idx}.html",
-                            'w', encoding='utf-8') as f:
-            await f.write(current_html)
+        await SessionManager._write_compressed_html(
+            SessionManager._undo_html_path(undo_dir, table_type, undo_idx),
+            current_html
+        )
         undo_stack.append(undo_idx)
 
         ts['undo'] = undo_stack
@@ -665,16 +1320,142 @@ class SessionManager:
 
         return next_html, state
 
+    @staticmethod
+    async def clear_redo_snapshots(session_id: str, table_type: str) -> None:
+        """Drop all redo snapshots for a table (forward history invalidated)."""
+        state = await SessionManager.load_undo_state(session_id)
+        ts = state.get(table_type)
+        if not ts or not ts.get('redo'):
+            return
+        undo_dir = SessionManager._undo_dir(session_id)
+        for idx in ts['redo']:
+            SessionManager._undo_html_path(undo_dir, table_type, idx).unlink(missing_ok=True)
+            (undo_dir / f"{table_type}_{idx}_edit_state.json").unlink(missing_ok=True)
+            (undo_dir / f"{table_type}_{idx}_row_change_state.json").unlink(missing_ok=True)
+        ts['redo'] = []
+        state[table_type] = ts
+        await SessionManager.save_undo_state(session_id, state)
+
     @staticmethod
     async def get_undo_availability(session_id: str, table_type: str) -> dict:
-        """Return ``{"can_undo": bool, "can_redo": bool}`` for the given table."""
+        """
+        Return ``{"can_undo": bool, "can_redo": bool}`` for the given table.
+
+        Considers both the pending edit log (value edits) and the snapshot
+        stacks (structural mutations).
+        """
         state = await SessionManager.load_undo_state(session_id)
         ts = state.get(table_type, {})
+        edit_log = await SessionManager.load_edit_log(session_id)
+        redo_log = await SessionManager._read_jsonl(SessionManager._redo_log_path(session_id))
         return {
-            'can_undo': len(ts.get('undo', [])) > 0,
-            'can_redo': len(ts.get('redo', [])) > 0,
+            'can_undo': bool(edit_log) or len(ts.get('undo', [])) > 0,
+            'can_redo': bool(redo_log) or len(ts.get('redo', [])) > 0,
         }
 
+    # ---------------------------------------------------------------------------
+    # Drafts index
+    #
+    # ``list_drafts`` used to load every session file one-by-one (N reads + N
+    # JSON parses) just to render the draft picker.  A single ``drafts_index.json``
+    # in the session directory holds only the summary fields the listing needs,
+    # so the endpoint becomes one read.  The index is updated on every
+    # ``save_session`` / ``delete_session`` via an atomic temp-file + rename, and
+    # rebuilt from a directory scan if it is ever missing or corrupt.
+    # ---------------------------------------------------------------------------
+
+    _index_path: Path = SESSION_DIR / 'drafts_index.json'
+
+    # In-memory mirror of the drafts index.  This process is the only writer
+    # of drafts_index.json (every mutation goes through _index_write), so once
+    # warm, listing drafts needs no syscalls at request time — the filesystem
+    # is consulted only on the first load after startup.
+    _index_cache: Optional[dict] = None
+
+    @staticmethod
+    def _index_entry(session: Session) -> dict:
+        """Build the summary dict stored in the drafts index for a session."""
+        return {
+            'session_id': session.session_id,
+            'draft_name': getattr(session, 'draft_name', None),
+            'has_metadata': session.has_metadata,
+            'has_citations': session.has_citations,
+            'created_at': session.created_at,
+            'last_updated': session.last_updated,
+        }
+
+    @staticmethod
+    def _index_load() -> Optional[dict]:
+        """
+        Return the drafts index as ``{session_id: entry}``, or None if unusable.
+
+        Served from the in-memory mirror when warm; falls back to one disk
+        read (which warms the mirror) otherwise.
+        """
+        if SessionManager._index_cache is not None:
+            return dict(SessionManager._index_cache)
+        if not SessionManager._index_path.exists():
+            return None
+        try:
+            with open(SessionManager._index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except Exception:
+            return None
+        if not isinstance(index, dict):
+            return None
+        SessionManager._index_cache = dict(index)
+        return index
+
+    @staticmethod
+    def _index_write(index: dict) -> None:
+        """Atomically replace the drafts index (temp file + ``os.replace``)."""
+        tmp_path = SessionManager._index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(index, indent=2))
+        os.replace(tmp_path, SessionManager._index_path)
+        SessionManager._index_cache = dict(index)
+
+    @staticmethod
+    def _index_upsert(session: Session) -> None:
+        """Insert or refresh the index entry for ``session``."""
+        index = SessionManager._index_load() or {}
+        index[session.session_id] = SessionManager._index_entry(session)
+        SessionManager._index_write(index)
+
+    @staticmethod
+    def _index_remove(session_id: str) -> None:
+        """Drop a session from the drafts index (no-op if absent)."""
+        index = SessionManager._index_load()
+        if index is None or session_id not in index:
+            return
+        del index[session_id]
+        SessionManager._index_write(index)
+
+    @staticmethod
+    async def list_drafts_summary() -> list:
+        """
+        List summary info for all saved drafts from the drafts index.
+
+        Falls back to rebuilding the index with one directory scan if the
+        index file is missing (e.g. first run after upgrade) or unreadable.
+
+        Returns:
+            List of summary dicts (session_id, draft_name, has_metadata,
+            has_citations, created_at, last_updated).
+        """
+        index = SessionManager._index_load()
+
+        if index is None:
+            # Rebuild from scratch: one pass over the session directories
+            index = {}
+            for session_id in SessionManager.list_sessions():
+                session = await SessionManager.load_session(session_id)
+                if session:
+                    index[session_id] = SessionManager._index_entry(session)
+            SessionManager._index_write(index)
+
+        return list(index.values())
+
     @staticmethod
     def list_sessions() -> list:
         """
@@ -699,11 +1480,31 @@ class SessionManager:
         Returns:
             True if deleted, False if not found
         """
+        SessionManager.invalidate(session_id)
+        SessionManager._index_remove(session_id)
+        _EDIT_STATE_CACHE.pop(session_id, None)
+        _EDITED_IDS_CACHE.pop(session_id, None)
+        for table_type in ('meta', 'cits', 'display'):
+            SessionManager._materialize_cache.pop((session_id, table_type), None)
+            SessionManager._item_index_cache.pop((session_id, table_type), None)
+        SessionManager._close_log_fd(SessionManager._edit_log_path(session_id))
+        SessionManager._close_log_fd(SessionManager._redo_log_path(session_id))
+
+        # Drop any debounced saves still pending for this session
+        handle = _PENDING_SAVES.pop(session_id, None)
+        if handle is not None:
+            handle.cancel()
+        _PENDING_SESSIONS.pop(session_id, None)
+        handle = _PENDING_STATE_SAVES.pop(session_id, None)
+        if handle is not None:
+            handle.cancel()
+        _PENDING_STATES.pop(session_id, None)
+
         session_dir = TEMP_DIR / session_id
-        
+
         if not session_dir.exists():
             return False
-        
+
         import shutil
         shutil.rmtree(session_dir)
         return True
\ No newline at end of file
@@ -1,9 +1,37 @@
 """Service for running validation using oc_validator."""
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
-from oc_validator.main import Validator, ClosureValidator
+# oc_validator is imported lazily inside the validate_* methods: importing
+# oc_validator.main is expensive (it loads validation rule tables) and would
+# otherwise run at every worker startup / --reload cycle before any
+# validation is requested.
+
+# Worker process pool for validation and HTML generation.  These are pure
+# Python and GIL-bound, so running them in a thread would still stall every
+# other coroutine's bytecode; separate processes keep the event loop
+# responsive and use multiple cores.  Created lazily on first validation so
+# processes are only spawned when actually needed.
+_validator_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_validator_pool() -> ProcessPoolExecutor:
+    """Return the shared validation process pool, creating it on first use."""
+    global _validator_pool
+    if _validator_pool is None:
+        _validator_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _validator_pool
+
+
+def shutdown_validator_pool() -> None:
+    """Shut down the validation process pool if it was ever created."""
+    global _validator_pool
+    if _validator_pool is not None:
+        _validator_pool.shutdown(wait=False, cancel_futures=True)
+        _validator_pool = None
 
 
 def load_jsonl_report(jsonl_path: str) -> list[dict]:
@@ -77,6 +105,8 @@ class ValidatorService:
         Returns:
             Tuple of (is_valid, report_jsonl_path).
         """
+        from oc_validator.main import Validator
+
         validator = Validator(
             csv_doc=csv_path,
             output_dir=output_dir,
@@ -137,6 +167,8 @@ class ValidatorService:
         Returns:
             Tuple of (meta_is_valid, cits_is_valid, meta_report_jsonl_path, cits_report_jsonl_path).
         """
+        from oc_validator.main import ClosureValidator
+
         validator = ClosureValidator(
             meta_in=meta_csv_path,
             meta_out_dir=meta_output_dir,
@@ -0,0 +1,83 @@
+"""Regression tests for undo/redo of structural edits.
+
+An undo-after-redo used to restore the wrong state: ``pop_redo_snapshot``
+wrote its undo-side snapshot as a plain ``.html`` file while the undo path
+only reads ``.html.zst``, and popped snapshot files were never deleted, so a
+reused index resolved to a stale compressed snapshot.
+"""
+import asyncio
+import re
+import shutil
+
+import httpx
+import pytest
+
+from main import app
+from services import SessionManager
+
+META_CSV = (
+    '"id","title","author","pub_date","venue","volume","issue","page",'
+    '"type","publisher","editor"\n'
+    '"doi:10.1162/qss_a_00023","OpenCitations","Peroni, Silvio","2020",'
+    '"Quantitative Science Studies","1","1","428-444","bogus type",'
+    '"MIT Press",""\n'
+)
+
+
+def _row_count(html: str) -> int:
+    # Attribute order varies between the generated and re-serialized HTML
+    return len(re.findall(r'<tr[^>]*\bid="row', html))
+
+
+@pytest.fixture
+def client():
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://testserver")
+
+
+def test_undo_redo_undo_structural_edit(client):
+    async def scenario():
+        async with client as c:
+            r = await c.post(
+                "/api/upload/",
+                files={"metadata_file": ("meta.csv", META_CSV, "text/csv")},
+            )
+            assert r.status_code == 200, r.text
+            session_id = r.json()["session_id"]
+
+            try:
+                r = await c.get(f"/api/edit/html/{session_id}")
+                assert r.status_code == 200
+                baseline_rows = _row_count(r.text)
+                assert baseline_rows > 0
+
+                # Structural edit: add a row
+                r = await c.post("/api/edit/row/add", json={"session_id": session_id})
+                assert r.status_code == 200, r.text
+                r = await c.get(f"/api/edit/html/{session_id}")
+                assert _row_count(r.text) == baseline_rows + 1
+
+                # Undo removes the added row
+                r = await c.post("/api/edit/undo", json={"session_id": session_id})
+                assert r.json()["success"], r.text
+                r = await c.get(f"/api/edit/html/{session_id}")
+                assert _row_count(r.text) == baseline_rows
+
+                # Redo brings it back
+                r = await c.post("/api/edit/redo", json={"session_id": session_id})
+                assert r.json()["success"], r.text
+                r = await c.get(f"/api/edit/html/{session_id}")
+                assert _row_count(r.text) == baseline_rows + 1
+
+                # Undo after redo must remove it again — this is the step that
+                # used to silently restore the stale post-add snapshot.
+                r = await c.post("/api/edit/undo", json={"session_id": session_id})
+                assert r.json()["success"], r.text
+                r = await c.get(f"/api/edit/html/{session_id}")
+                assert _row_count(r.text) == baseline_rows
+            finally:
+                await SessionManager.flush_pending()
+                SessionManager.delete_session(session_id)
+                shutil.rmtree(f"temp/{session_id}", ignore_errors=True)
+
+    asyncio.run(scenario())